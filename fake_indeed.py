@@ -0,0 +1,358 @@
+import argparse
+import hashlib
+import html
+import json
+import random
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlparse
+
+import indeed_bot
+
+PAGE_SIZE = 10
+JOB_TYPES = ["fulltime", "parttime", "internship", "contract"]
+JOB_TYPE_LABELS = {"fulltime": "Vollzeit", "parttime": "Teilzeit", "internship": "Praktikum", "contract": "Befristet"}
+COMPANIES = ["Sanssouci Software GmbH", "Havel Analytics", "Babelsberg Media AG", "Brandenburg Logistik", "Potsdam Labs"]
+TITLES = ["Working Student Data", "Werkstudent Softwareentwicklung", "Working Student Marketing",
+          "Praktikant IT-Support", "Senior Backend Engineer", "Werkstudent Controlling"]
+
+TEXTS = {
+    "de": {"step": "Schritt {step} von {steps}", "next": "Weiter", "submit": "Bewerbung absenden",
+           "done": "Bewerbung gesendet", "question": "Wie viele Jahre Erfahrung haben Sie mit Python?",
+           "required": "Bitte beantworten Sie diese Frage."},
+    "en": {"step": "Step {step} of {steps}", "next": "Continue", "submit": "Submit your application",
+           "done": "Application submitted", "question": "How many years of Python experience do you have?",
+           "required": "Please answer this question."},
+}
+
+PAGE = """<!DOCTYPE html>
+<html lang="de"><head><meta charset="utf-8"><title>{title}</title>
+<style>
+body {{ font-family: sans-serif; margin: 0; }}
+.layout {{ display: flex; }}
+.results {{ width: 45%; }}
+#jobsearch-ViewjobPaneWrapper {{ width: 55%; padding: 1em; }}
+.job_seen_beacon {{ border: 1px solid #ccc; margin: 0.5em; padding: 0.5em; cursor: pointer; }}
+#indeedApplyButton {{ background-color: rgb(37, 87, 167); color: white; padding: 0.5em 1em; border: 0; }}
+.apply-step button {{ display: flex; padding: 0.5em 1em; }}
+.popover {{ position: fixed; top: 20%; left: 30%; padding: 2em; background: white; border: 2px solid black; }}
+</style></head>
+<body><header><a id="AccountMenu" href="/">Mein Konto</a></header>{body}</body></html>"""
+
+def job_details(index):
+    """Deterministic attributes of the fake job with the given index."""
+    job_key = hashlib.sha1(str(index).encode()).hexdigest()[:16]
+    rng = random.Random(index)
+    return {
+        "index": index,
+        "job_key": job_key,
+        "title": TITLES[index % len(TITLES)],
+        "company": COMPANIES[index % len(COMPANIES)],
+        "location": "Potsdam",
+        "job_type": JOB_TYPES[index % len(JOB_TYPES)],
+        "language": "de" if index % 2 == 0 else "en",
+        "steps": 2 + index % 3,
+        "age_days": rng.randint(0, 30),
+        "rng": rng,
+    }
+
+class FakeIndeed:
+    """Synthetic Indeed site: search form, results, detail pane and apply forms."""
+
+    def __init__(self, jobs=50, latency=0.0, fail_rate=0.0, popup_rate=0.1,
+                 easy_apply_rate=0.6, question_rate=0.0, seed=1):
+        self.latency = latency
+        self.fail_rate = fail_rate
+        self.popup_rate = popup_rate
+        self.random = random.Random(seed)
+        self.jobs = []
+        for index in range(jobs):
+            job = job_details(index)
+            job["easy_apply"] = job["rng"].random() < easy_apply_rate
+            job["question"] = job["easy_apply"] and job["rng"].random() < question_rate
+            self.jobs.append(job)
+        self.by_key = {job["job_key"]: job for job in self.jobs}
+        self.applications = []
+        self.requests = 0
+        self.lock = threading.Lock()
+
+    def search(self, params):
+        """Jobs matching the search parameters."""
+        job_type = params.get("jt")
+        matches = [job for job in self.jobs if not job_type or job["job_type"] == job_type]
+        if params.get("sort") == "date":
+            matches.sort(key=lambda job: job["age_days"])
+        return matches
+
+    def home_page(self):
+        body = """
+<form action="/jobs" method="get">
+  <input id="text-input-what" name="q" placeholder="Jobtitel">
+  <input id="text-input-where" name="l" placeholder="Ort">
+  <button type="submit">Jobs finden</button>
+</form>"""
+        return PAGE.format(title="Jobsuche", body=body)
+
+    def results_page(self, params):
+        matches = self.search(params)
+        if not matches:
+            # Like Indeed, a search without matches shows a message instead of the results list
+            body = f"""
+<div class="jobsearch-NoResult-messageContainer">
+  <h1>Die Suche nach <b>{html.escape(params.get('q', ''))}</b> ergab keine Treffer.</h1>
+</div>"""
+            return PAGE.format(title="Jobs", body=body)
+        start = int(params.get("start", 0))
+        page = matches[start:start + PAGE_SIZE]
+        if not page and matches:
+            # Like Indeed, offsets past the end show the last page again
+            start = (len(matches) - 1) // PAGE_SIZE * PAGE_SIZE
+            page = matches[start:start + PAGE_SIZE]
+
+        def link(**changes):
+            query = {key: value for key, value in params.items() if key != "vjk"}
+            query.update(changes)
+            return "/jobs?" + urlencode({key: value for key, value in query.items() if value not in (None, "")})
+
+        cards = []
+        payload = []
+        for job in page:
+            label = '<span class="iaLabel" data-testid="indeedApply">Einfach bewerben</span>' if job["easy_apply"] else ""
+            cards.append(f"""
+<li><div class="cardOutline job_seen_beacon" onclick="location.href='{link(vjk=job['job_key'], start=params.get('start'))}'">
+  <h2 class="jobTitle"><a data-jk="{job['job_key']}" href="{link(vjk=job['job_key'], start=params.get('start'))}">
+    <span title="{html.escape(job['title'])}">{html.escape(job['title'])}</span></a></h2>
+  <span data-testid="company-name">{html.escape(job['company'])}</span>
+  <div data-testid="text-location">{job['location']}</div>
+  {label}
+  <span data-testid="myJobsStateDate">vor {job['age_days']} Tagen</span>
+</div></li>""")
+            payload.append({
+                "jobkey": job["job_key"],
+                "displayTitle": job["title"],
+                "company": job["company"],
+                "formattedLocation": job["location"],
+                "indeedApplyEnabled": job["easy_apply"],
+                "formattedRelativeTime": f"vor {job['age_days']} Tagen",
+                "pubDate": int((time.time() - job["age_days"] * 86400) * 1000),
+            })
+
+        filters = "".join(
+            f"""<button type="button" onclick="location.href='{link(jt=job_type, start=None)}'">{label}</button>"""
+            for job_type, label in JOB_TYPE_LABELS.items())
+        next_link = ""
+        if start + PAGE_SIZE < len(matches):
+            next_link = f'<a aria-label="Next" href="{link(start=start + PAGE_SIZE)}">Weiter</a>'
+
+        job = self.by_key.get(params.get("vjk"))
+        pane = self.job_pane(job) if job else ""
+
+        popup = ""
+        if self.random.random() < self.popup_rate:
+            popup = """<script>setTimeout(function () {
+  var popup = document.createElement('div');
+  popup.className = 'popover';
+  popup.innerHTML = '<p>Newsletter abonnieren?</p><button class="icl-CloseButton" aria-label="Close">x</button>';
+  popup.querySelector('button').onclick = function () { popup.remove(); };
+  document.body.appendChild(popup);
+}, 300);</script>"""
+
+        body = f"""
+<div>{filters}</div>
+<div class="layout">
+  <ul class="results" id="mosaic-provider-jobcards">{''.join(cards)}</ul>
+  <div id="jobsearch-ViewjobPaneWrapper">{pane}</div>
+</div>
+<nav>{next_link}</nav>
+<script>window.mosaic = {{providerData: {{}}}};
+window.mosaic.providerData["mosaic-provider-jobcards"]={json.dumps({"metaData": {"mosaicProviderJobCardsModel": {"results": payload}}})};</script>
+{popup}"""
+        return PAGE.format(title="Jobs", body=body)
+
+    def job_pane(self, job):
+        """Job details with the apply button, as in the detail pane and on the job page."""
+        if job["easy_apply"]:
+            apply = (f"""<button id="indeedApplyButton" onclick="window.open('/apply?jk={job['job_key']}&step=1')">"""
+                     """<span class="jobsearch-IndeedApplyButton-newDesign">Schnellbewerbung</span></button>""")
+        else:
+            apply = '<button type="button">Auf Unternehmenswebsite bewerben</button>'
+        return f"""
+<h2 class="jobsearch-JobInfoHeader-title">{html.escape(job['title'])}</h2>
+<div data-jk="{job['job_key']}">{html.escape(job['company'])} - {job['location']}</div>
+{apply}
+<p>Beschreibung der Stelle {job['index']}.</p>"""
+
+    def job_page(self, params):
+        job = self.by_key.get(params.get("jk"))
+        if not job:
+            return None
+        body = f"""<div id="jobsearch-ViewjobPaneWrapper">{self.job_pane(job)}</div>"""
+        return PAGE.format(title=html.escape(job["title"]), body=body)
+
+    def apply_page(self, params):
+        job = self.by_key.get(params.get("jk"))
+        if not job:
+            return None
+        texts = TEXTS[job["language"]]
+        step = int(params.get("step", 1))
+        if step > job["steps"]:
+            with self.lock:
+                self.applications.append(job["job_key"])
+            return PAGE.format(title=texts["done"], body=f"<h1>{texts['done']}</h1>")
+
+        next_url = f"/apply?jk={job['job_key']}&step={step + 1}"
+        question = ""
+        check = "true"
+        if job["question"] and step == 1:
+            question = f"""
+<label for="q-experience">{texts['question']}</label>
+<input id="q-experience" name="q-experience" type="number" required>
+<div class="error" id="q-error"></div>"""
+            check = f"""(document.getElementById('q-experience').value ||
+  (document.getElementById('q-error').innerText = '{texts['required']}', false))"""
+        button = texts["submit"] if step == job["steps"] else texts["next"]
+        body = f"""
+<div class="apply-step">
+  <h1>{texts['step'].format(step=step, steps=job['steps'])}</h1>
+  {question}
+  <button type="button" onclick="if ({check}) location.href='{next_url}'">{button}</button>
+</div>"""
+        return PAGE.format(title=texts["step"].format(step=step, steps=job["steps"]), body=body)
+
+def make_handler(site):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def do_GET(self):
+            with site.lock:
+                site.requests += 1
+            if site.latency:
+                time.sleep(site.latency * (0.5 + site.random.random()))
+            url = urlparse(self.path)
+            params = {key: values[0] for key, values in parse_qs(url.query).items()}
+            if url.path != "/" and site.random.random() < site.fail_rate:
+                self.respond(503, "<h1>Service Unavailable</h1>")
+                return
+            if url.path == "/":
+                page = site.home_page()
+            elif url.path == "/jobs":
+                page = site.results_page(params)
+            elif url.path == "/viewjob":
+                page = site.job_page(params)
+            elif url.path == "/apply":
+                page = site.apply_page(params)
+            else:
+                page = None
+            if page is None:
+                self.respond(404, "<h1>Not Found</h1>")
+            else:
+                self.respond(200, page)
+
+        def respond(self, status, page):
+            data = page.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            # The visitor is always logged in, like a saved Indeed session
+            self.send_header("Set-Cookie", "SHOE=fake-session; Path=/; HttpOnly")
+            self.end_headers()
+            self.wfile.write(data)
+
+    return Handler
+
+def start_server(site, port=0):
+    """Serve site on localhost in a background thread; return the server."""
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(site))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def run_benchmark(site, server, args):
+    """Drive the real bot code against the fake site and report its throughput."""
+    work_dir = tempfile.mkdtemp(prefix="indeed-bench-")
+    filters = {
+        "job_title": "Working Student",
+        "location": "Potsdam",
+        "indeed_url": f"http://127.0.0.1:{server.server_port}/",
+        "wait_profile": args.wait_profile,
+        "lean": "true",
+        "headless": "false" if args.show_browser else "true",
+        "job_index": f"{work_dir}/jobs.sqlite3",
+        "locator_stats": f"{work_dir}/locator_stats.json",
+        "trace": f"{work_dir}/trace.jsonl",
+        "profile_dir": f"{work_dir}/chrome_profile",
+        "answers": f"{work_dir}/answers.txt",
+        "unanswered_questions": f"{work_dir}/unanswered_questions.txt",
+    }
+    with open(filters["answers"], "w", encoding="utf-8") as file:
+        file.write("Jahre Erfahrung Python = 3\nyears of Python experience = 3\n")
+    if args.job_type:
+        filters["job_type"] = args.job_type
+    if args.apply_tabs:
+        filters["apply_tabs"] = str(args.apply_tabs)
+    indeed_bot.set_wait_profile(filters["wait_profile"])
+    indeed_bot.locators.load(filters["locator_stats"])
+    indeed_bot.answers.load(filters["answers"], filters["unanswered_questions"])
+    indeed_bot.tracer.configure(filters["trace"])
+    job_index = indeed_bot.JobIndex(filters["job_index"])
+
+    driver = indeed_bot.start_session(filters)
+    try:
+        started = time.perf_counter()
+        stats = indeed_bot.run_search(driver, filters, job_index)
+        elapsed = time.perf_counter() - started
+    finally:
+        job_index.close()
+        driver.quit()
+
+    minutes = elapsed / 60
+    jobs = stats["inspected"] + stats["skipped"]
+    print(f"\nBenchmark: {jobs} jobs in {elapsed:.1f}s, {jobs / minutes:.1f} jobs/minute, "
+          f"{stats['applied']} applications ({stats['applied'] / minutes:.1f}/minute)")
+    print(f"Server saw {site.requests} requests and {len(site.applications)} submitted applications")
+    indeed_bot.print_wait_report()
+    indeed_bot.print_navigation_report()
+    indeed_bot.tracer.report(stats)
+    indeed_bot.tracer.close()
+    print(f"Trace and job index written to {work_dir}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Local fake Indeed site for testing and benchmarking the bot.")
+    parser.add_argument("--port", type=int, default=8000, help="port to serve on (0 picks a free one)")
+    parser.add_argument("--jobs", type=int, default=50, help="number of job postings")
+    parser.add_argument("--latency", type=float, default=0.0, help="average response delay in seconds")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="share of requests answered with 503")
+    parser.add_argument("--popup-rate", type=float, default=0.1, help="share of results pages showing a popup")
+    parser.add_argument("--easy-apply-rate", type=float, default=0.6, help="share of jobs offering Easy Apply")
+    parser.add_argument("--question-rate", type=float, default=0.0,
+                        help="share of Easy Apply forms with a required screening question")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--benchmark", action="store_true", help="run the bot against the site and report timings")
+    parser.add_argument("--wait-profile", default="fast", help="wait profile used by the benchmark")
+    parser.add_argument("--job-type", help="job_type filter used by the benchmark "
+                        "(temporary matches no job, for a search without results)")
+    parser.add_argument("--apply-tabs", type=int, default=0,
+                        help="apply in this many background tabs while the results tab goes on (benchmark)")
+    parser.add_argument("--show-browser", action="store_true", help="run the benchmark browser with a window")
+    args = parser.parse_args()
+
+    site = FakeIndeed(jobs=args.jobs, latency=args.latency, fail_rate=args.fail_rate,
+                      popup_rate=args.popup_rate, easy_apply_rate=args.easy_apply_rate,
+                      question_rate=args.question_rate, seed=args.seed)
+    server = start_server(site, 0 if args.benchmark else args.port)
+    if args.benchmark:
+        run_benchmark(site, server, args)
+        server.shutdown()
+        return
+    print(f"Fake Indeed running on http://127.0.0.1:{server.server_port}/ "
+          f"(set indeed_url to this address in job_filters.txt)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,499 @@
 import undetected_chromedriver as uc
+import argparse
+import difflib
+import json
+import math
+import multiprocessing
+import os
+import queue
+import re
+import shutil
+import signal
+import sqlite3
+import threading
 import time
+from collections import deque
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass
+from html.parser import HTMLParser
+from typing import Generator, Optional
+from urllib.parse import parse_qs, urlencode, urljoin, urlparse
 from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    TimeoutException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+)
 from selenium.webdriver.common.action_chains import ActionChains
 
+INDEED_URL = "https://de.indeed.com/"  # German Indeed site
+CHROME_VERSION = 133  # Chrome major version the chromedriver is patched for
+
+# Indeed sets these cookies only for a logged-in session, and shows the
+# account menu in the page header.
+LOGIN_COOKIES = ("SHOE", "SOCK")
+ACCOUNT_MENU_SELECTOR = "#AccountMenu, [data-gnav-element-name='AccountMenu']"
+
+# Values of Indeed's "jt" search parameter for the job types in job_filters.txt
+JOB_TYPE_PARAMS = {
+    'full-time': 'fulltime',
+    'part-time': 'parttime',
+    'contract': 'contract',
+    'internship': 'internship'
+}
+
+RESULTS_PAGE_SIZE = 10  # Indeed's "start" parameter moves in steps of one page
+MAX_PAGE_ATTEMPTS = 3  # loads of a results page before its search is given up for the run
+
+# URL patterns lean mode blocks per resource type, and trackers it always blocks
+LEAN_BLOCKED_RESOURCES = {
+    "image": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico"],
+    "font": ["*.woff", "*.woff2", "*.ttf", "*.otf"],
+    "media": ["*.mp4", "*.webm", "*.mp3", "*.ogg"],
+}
+LEAN_BLOCKED_URLS = [
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*googlesyndication.com*",
+    "*facebook.net*",
+    "*hotjar.com*",
+    "*bat.bing.com*",
+]
+
+browser_settings = {"blocked_urls": []}
+navigation_stats = []
+
+# Load time of the current document and the bytes Chrome reports for it and
+# its subresources (cross-origin responses without timing headers count as 0).
+NAVIGATION_METRICS_JS = """
+var nav = performance.getEntriesByType('navigation')[0];
+if (!nav) return null;
+var resources = performance.getEntriesByType('resource');
+var bytes = nav.transferSize;
+resources.forEach(function (entry) { bytes += entry.transferSize || 0; });
+return {
+    url: location.href,
+    load_ms: (nav.loadEventEnd || performance.now()) - nav.startTime,
+    bytes: bytes,
+    requests: resources.length + 1
+};
+"""
+
+# Named wait conditions and their timeouts in seconds. "legacy" is the fixed
+# sleep each condition replaced; it is only used for the timing report.
+WAIT_CONDITIONS = {
+    "results_loaded": {"timeout": 10, "legacy": 3},
+    "detail_pane_changed": {"timeout": 10, "legacy": 3},
+    "new_window_opened": {"timeout": 10, "legacy": 2},
+    "apply_form_loaded": {"timeout": 15, "legacy": 3},
+    "apply_step_advanced": {"timeout": 8, "legacy": 2},
+    "window_claimed": {"timeout": 20, "legacy": 0},
+    "job_page_loaded": {"timeout": 15, "legacy": 3},
+    "popup_closed": {"timeout": 2, "legacy": 0.5},
+}
+
+# "normal" keeps the visual feedback, "fast" skips the cosmetic highlighting.
+WAIT_PROFILES = {
+    "normal": {"highlight": True, "poll": 0.25},
+    "fast": {"highlight": False, "poll": 0.1},
+}
+
+wait_settings = dict(WAIT_PROFILES["normal"])
+wait_stats = {}
+
+# Selector for the job detail pane shown next to the results list.
+DETAIL_PANE_SELECTOR = "#jobsearch-ViewjobPaneWrapper, .jobsearch-RightPane, #vjs-container"
+
+# Both scripts identify the pane contents by the start of its text, so two
+# postings with the same title are still told apart by company and location.
+DETAIL_PANE_JS = """
+var jk = arguments[0], previousSignature = arguments[1];
+var pane = document.querySelector(arguments[2]);
+if (!pane || !pane.querySelector('h1, h2')) return false;
+var signature = pane.innerText.trim().slice(0, 300);
+if (!signature || signature === previousSignature) return false;
+return !jk || location.href.indexOf('vjk=' + jk) !== -1 || !!pane.querySelector('[data-jk="' + jk + '"]');
+"""
+
+CARD_CLICK_JS = """
+var card = arguments[0];
+card.scrollIntoView(true);
+var link = card.matches('[data-jk]') ? card : card.querySelector('[data-jk]');
+var pane = document.querySelector(arguments[1]);
+return [link ? link.getAttribute('data-jk') : null, pane ? pane.innerText.trim().slice(0, 300) : null];
+"""
+
+# Candidate selectors for the Easy Apply button, most specific first.
+EASY_APPLY_SELECTORS = [
+    "#indeedApplyButton",
+    "button[class*='css-km0m34']",
+    "button[aria-label*='Schnellbewerbung']",
+    "button[aria-label*='Quick Apply']",
+]
+# Fallback that checks all buttons; always probed last and never ranked, since
+# any blue button on the page would credit it
+EASY_APPLY_FALLBACK_SELECTOR = "button"
+EASY_APPLY_COLORS = ("rgb(37, 87, 167)", "#2557a7")
+
+# Snapshot of every element matching any of arguments[0], each element listed
+# once, with everything the button checks need and the element to click.
+BUTTON_PROBE_JS = """
+var seen = new Set(), snapshot = [];
+arguments[0].forEach(function (selector) {
+    document.querySelectorAll(selector).forEach(function (el) {
+        if (seen.has(el)) return;
+        seen.add(el);
+        var style = window.getComputedStyle(el);
+        var text = el.innerText || '';
+        if (!text.trim()) {
+            var inner = el.querySelector(
+                '.jobsearch-IndeedApplyButton-contentWrapper, span.jobsearch-IndeedApplyButton-newDesign');
+            text = inner ? inner.innerText : '';
+        }
+        snapshot.push({
+            element: el,
+            selector: selector,
+            visible: el.getClientRects().length > 0 && style.visibility !== 'hidden' && style.opacity !== '0',
+            enabled: !el.disabled && el.getAttribute('aria-disabled') !== 'true',
+            background: style.backgroundColor,
+            display: style.display,
+            text: text.replace(/\\s+/g, ' ').trim().toLowerCase().slice(0, 100)
+        });
+    });
+});
+return snapshot;
+"""
+
+# Texts that show an application went through
+SUCCESS_TEXTS = [
+    'bewerbung gesendet',  # Application sent
+    'application submitted',
+    'successfully submitted',
+    'thank you for applying'
+]
+
+# Compact fingerprint of an apply form page: the step (address, heading
+# and field names), whether a success banner shows, the validation errors
+# and the visible buttons. Only the body text of pages without buttons is
+# searched for success texts, and none of it leaves the browser.
+APPLY_STATE_JS = """
+var successTexts = arguments[0];
+function clean(text) { return (text || '').replace(/\\s+/g, ' ').trim().toLowerCase(); }
+function visible(el) { return el.getClientRects().length > 0; }
+function texts(selector, limit) {
+    var seen = [];
+    Array.prototype.forEach.call(document.querySelectorAll(selector), function (el) {
+        var text = clean(el.innerText || el.value).slice(0, limit);
+        if (text && visible(el) && seen.indexOf(text) < 0) seen.push(text);
+    });
+    return seen;
+}
+function hasSuccess(text) {
+    return successTexts.some(function (phrase) { return text.indexOf(phrase) >= 0; });
+}
+var heading = document.querySelector('h1, h2');
+var names = Array.prototype.map.call(
+    document.querySelectorAll('input, select, textarea'),
+    function (el) { return el.name || el.id; }
+);
+var buttons = texts('button:not([disabled]), [role="button"], input[type="submit"], input[type="button"]', 60);
+var banners = texts('h1, h2, h3, [role="status"], [role="alert"], [class*="success"], [class*="confirm"]', 200);
+var success = hasSuccess(clean(document.title)) || banners.some(hasSuccess)
+    || (!buttons.length && document.body && hasSuccess(clean(document.body.innerText)));
+return {
+    step: [location.href, heading ? heading.innerText : '', names.join(',')].join('|'),
+    success: success,
+    errors: texts('[role="alert"], [class*="error"], [aria-live="assertive"]', 200).slice(0, 5),
+    buttons: buttons
+};
+"""
+
+class _Span:
+    """One timed phase of the run; use through Tracer.span()."""
+
+    def __init__(self, tracer, name, attrs):
+        self.tracer = tracer
+        self.name = name
+        self.attrs = attrs
+        self.commands = 0
+        self.command_time = 0.0
+
+    def __enter__(self):
+        self.tracer.stack.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.tracer.finish(self, time.perf_counter() - self.start, exc_type)
+        return False
+
+class Tracer:
+    """Nested timing spans over the phases of a run, written as JSONL events.
+
+    instrument() counts the WebDriver commands issued inside each span. When
+    tracing is off, span() returns a shared no-op context manager.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.stack = []
+        self.durations = {}
+        self.commands = {}
+        self.command_count = 0
+        self.command_time = 0.0
+        self.sleep_time = 0.0
+        self.started = time.perf_counter()
+        self.file = None
+
+    def configure(self, path):
+        """Start tracing to the JSONL file at path."""
+        self.enabled = True
+        self.started = time.perf_counter()
+        self.file = open(path, "a")
+
+    def span(self, name, **attrs):
+        """Return a context manager timing the phase name."""
+        if not self.enabled:
+            return NO_SPAN
+        return _Span(self, name, attrs)
+
+    def finish(self, span, duration, exc_type):
+        self.stack.remove(span)
+        self.durations.setdefault(span.name, []).append(duration)
+        self.commands.setdefault(span.name, []).append(span.commands)
+        event = {
+            "span": span.name,
+            "path": "/".join([parent.name for parent in self.stack] + [span.name]),
+            "time": time.time(),
+            "duration_ms": round(duration * 1000, 2),
+            "commands": span.commands,
+            "command_ms": round(span.command_time * 1000, 2),
+            "error": exc_type.__name__ if exc_type else None,
+        }
+        event.update(span.attrs)
+        self.file.write(json.dumps(event) + "\n")
+
+    def instrument(self, driver):
+        """Count every WebDriver command of driver in the open spans."""
+        execute = driver.execute
+
+        def counted_execute(driver_command, params=None):
+            start = time.perf_counter()
+            try:
+                return execute(driver_command, params)
+            finally:
+                self.count_command(time.perf_counter() - start)
+
+        driver.execute = counted_execute
+
+    def count_command(self, elapsed):
+        self.command_count += 1
+        self.command_time += elapsed
+        for span in self.stack:
+            span.commands += 1
+            span.command_time += elapsed
+
+    def add_sleep(self, elapsed):
+        """Count time spent sleeping or polling between browser commands."""
+        self.sleep_time += elapsed
+
+    def report(self, stats):
+        """Print percentiles per phase, throughput and where the wall time went."""
+        if not self.enabled:
+            return
+        self.file.flush()
+        wall = time.perf_counter() - self.started
+        print("\nRun profile:")
+        print(f"  {'phase':<18} {'n':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'cmds/span':>10}")
+        for name, durations in sorted(self.durations.items()):
+            ordered = sorted(durations)
+            def percentile(p):
+                return ordered[min(len(ordered) - 1, int(p * len(ordered)))] * 1000
+            commands = sum(self.commands[name]) / len(self.commands[name])
+            print(f"  {name:<18} {len(ordered):>6} {percentile(0.5):>9.0f} {percentile(0.95):>9.0f} "
+                  f"{percentile(0.99):>9.0f} {commands:>10.1f}")
+        hours = wall / 3600
+        jobs = stats.get("inspected", 0) + stats.get("skipped", 0)
+        print(f"  {jobs / hours:.0f} jobs/hour, {stats.get('applied', 0) / hours:.1f} applications/hour")
+        print(f"  wall time {wall:.0f}s: {self.sleep_time / wall:.0%} sleeping/waiting, "
+              f"{self.command_time / wall:.0%} in {self.command_count} browser commands")
+
+    def close(self):
+        if self.file:
+            self.file.close()
+            self.file = None
+
+NO_SPAN = nullcontext()
+tracer = Tracer()
+
+def set_wait_profile(name):
+    """Switch the wait engine to one of the WAIT_PROFILES."""
+    if name not in WAIT_PROFILES:
+        print(f"Unknown wait profile '{name}', using 'normal'")
+        name = "normal"
+    wait_settings.clear()
+    wait_settings.update(WAIT_PROFILES[name])
+
+def _record_wait(name, waited, legacy, timed_out=False):
+    """Accumulate timing numbers for the wait report."""
+    stats = wait_stats.setdefault(name, {"count": 0, "waited": 0.0, "legacy": 0.0, "timeouts": 0})
+    stats["count"] += 1
+    stats["waited"] += waited
+    stats["legacy"] += legacy
+    stats["timeouts"] += int(timed_out)
+
+def wait_for(driver, name, condition, timeout=None):
+    """Wait until a named condition holds and return its value, or False on timeout."""
+    spec = WAIT_CONDITIONS[name]
+    start = time.perf_counter()
+    command_time = tracer.command_time
+    try:
+        result = WebDriverWait(
+            driver,
+            timeout or spec["timeout"],
+            poll_frequency=wait_settings["poll"],
+            ignored_exceptions=(NoSuchElementException, StaleElementReferenceException),
+        ).until(condition)
+        timed_out = False
+    except TimeoutException:
+        print(f"Timed out waiting for {name}")
+        result = False
+        timed_out = True
+    waited = time.perf_counter() - start
+    _record_wait(name, waited, spec["legacy"], timed_out)
+    # The polls are counted as browser commands; the rest of the wait is sleep
+    tracer.add_sleep(waited - (tracer.command_time - command_time))
+    return result
+
+def pause(seconds):
+    """Sleep for a fixed time that no DOM condition can replace."""
+    start = time.perf_counter()
+    time.sleep(seconds)
+    _record_wait("pause", time.perf_counter() - start, 0)
+    tracer.add_sleep(time.perf_counter() - start)
+
+def print_wait_report():
+    """Print how long each wait condition took compared to the old fixed sleeps."""
+    if not wait_stats:
+        return
+    print("\nWait timings:")
+    total_waited = total_legacy = 0.0
+    for name, stats in sorted(wait_stats.items()):
+        total_waited += stats["waited"]
+        total_legacy += stats["legacy"]
+        print(f"  {name:<22} n={stats['count']:<5} waited={stats['waited']:8.1f}s "
+              f"fixed={stats['legacy']:8.1f}s timeouts={stats['timeouts']}")
+    print(f"  total waited {total_waited:.1f}s vs {total_legacy:.1f}s of fixed sleeps "
+          f"(saved {total_legacy - total_waited:.1f}s)")
+
+def results_loaded(driver):
+    """Condition: job cards are present on the results page."""
+    return driver.find_elements(By.CLASS_NAME, "job_seen_beacon") or False
+
+def results_page_ready(driver):
+    """Condition: the results page finished loading, with or without job cards."""
+    return results_loaded(driver) or document_ready(driver)
+
+# HTTP status of the current document (0 if Chrome does not report it),
+# whether it has a results list and whether it says that nothing matched;
+# the arguments are RESULTS_LIST_SELECTOR, NO_RESULTS_SELECTOR and NO_RESULTS_TEXTS
+RESULTS_PAGE_STATUS_JS = """
+var nav = performance.getEntriesByType('navigation')[0];
+var text = document.body ? document.body.innerText.toLowerCase() : '';
+return {status: (nav && nav.responseStatus) || 0, results: !!document.querySelector(arguments[0]),
+        empty: !!document.querySelector(arguments[1]) || arguments[2].some(function (t) { return text.indexOf(t) !== -1; })};
+"""
+RESULTS_LIST_SELECTOR = "#mosaic-provider-jobcards, .jobsearch-ResultsList, .job_seen_beacon"
+# Indeed's page for a search without any matches
+NO_RESULTS_SELECTOR = ".jobsearch-NoResult-messageContainer"
+NO_RESULTS_TEXTS = ["ergab keine treffer", "did not match any jobs"]
+
+class ResultsPageError(Exception):
+    """A results page did not load: an HTTP error or a page without a results list."""
+
+def check_results_page(driver):
+    """Return True for a results page with jobs, False if Indeed says nothing matched.
+
+    Raises ResultsPageError for anything else, since a page that failed
+    must never be taken for the end of a search.
+    """
+    page = driver.execute_script(RESULTS_PAGE_STATUS_JS, RESULTS_LIST_SELECTOR, NO_RESULTS_SELECTOR,
+                                 NO_RESULTS_TEXTS)
+    if page["status"] >= 400:
+        raise ResultsPageError(f"results page answered with HTTP {page['status']}")
+    if page["results"]:
+        return True
+    if page["empty"]:
+        return False
+    raise ResultsPageError("page has no results list")
+
+def detail_pane_changed(job_key=None, previous_signature=None):
+    """Condition: the job detail pane switched to the card with the given job key."""
+    def condition(driver):
+        return driver.execute_script(DETAIL_PANE_JS, job_key, previous_signature, DETAIL_PANE_SELECTOR)
+    return condition
+
+def new_window_opened(handles_before):
+    """Condition: a window appeared that was not in handles_before; returns its handle.
+
+    Windows in the registry are never new: tabs the bot opened itself
+    meanwhile (a prefetch or another apply tab) do not count. Returns "same"
+    instead if the apply form opened in the current tab.
+    """
+    def condition(driver):
+        known = set(handles_before) | set(windows.handles.values())
+        new_handles = [h for h in driver.window_handles if h not in known]
+        if new_handles:
+            return new_handles[0]
+        return "same" if re.search(APPLY_FORM_URL_PATTERN, driver.current_url, re.IGNORECASE) else False
+    return condition
+
+def document_ready(driver):
+    """Condition: the current document finished loading."""
+    return driver.execute_script("return document.readyState") == "complete"
+
+def job_page_loaded(job_key):
+    """Condition: the job page of job_key finished loading in the current tab."""
+    def condition(driver):
+        return driver.execute_script(
+            "return document.readyState === 'complete' && location.href.indexOf(arguments[0]) >= 0", job_key)
+    return condition
+
+def apply_form_loaded(driver):
+    """Condition: the apply form finished loading and shows a button."""
+    return document_ready(driver) and bool(driver.find_elements(By.CSS_SELECTOR, "button"))
+
+def apply_state(driver):
+    """Return the fingerprint of the apply form page (see APPLY_STATE_JS)."""
+    return driver.execute_script(APPLY_STATE_JS, SUCCESS_TEXTS)
+
+def apply_step_advanced(previous):
+    """Condition: the apply form left the state previous, by a new step, new errors or success.
+
+    Returns the new state.
+    """
+    def condition(driver):
+        state = apply_state(driver)
+        if state["success"] or state["step"] != previous["step"] or state["errors"] != previous["errors"]:
+            return state
+        return False
+    return condition
+
+def element_gone(element):
+    """Condition: the element was removed or hidden."""
+    def condition(driver):
+        try:
+            return not element.is_displayed()
+        except StaleElementReferenceException:
+            return True
+    return condition
+
+# Settings that may be given on several lines; they are read as lists
+MULTI_VALUE_KEYS = ("search", "include_regex", "exclude_regex")
+
 def read_job_filters(file_path="job_filters.txt"):
     """Reads job filters from a text file."""
     filters = {}
@@ -15,127 +502,517 @@ def read_job_filters(file_path="job_filters.txt"):
             for line in file:
                 if "=" in line and not line.strip().startswith("#"):
                     key, value = line.strip().split("=", 1)
-                    filters[key.strip()] = value.strip()
+                    if key.strip() in MULTI_VALUE_KEYS:
+                        filters.setdefault(key.strip(), []).append(value.strip())
+                    else:
+                        filters[key.strip()] = value.strip()
     except FileNotFoundError:
         print(f"Error: {file_path} not found. Please create the file with job filters.")
         exit()
     return filters
 
-def search_jobs(driver, filters):
-    """Search for jobs using the provided filters."""
+def build_search_url(filters, start=0, job_type=None):
+    """Build the results page URL for the filters, starting at result offset start."""
+    params = {"q": filters["job_title"], "l": filters["location"]}
+    if job_type:
+        params["jt"] = JOB_TYPE_PARAMS.get(job_type.lower(), job_type)
+    if filters.get("radius"):
+        params["radius"] = filters["radius"]
+    if is_enabled(filters, "incremental"):
+        params["sort"] = "date"
+    if start:
+        params["start"] = start
+    return urljoin(filters.get("indeed_url", INDEED_URL), "jobs?" + urlencode(params))
+
+def build_job_url(filters, job_key):
+    """Build the URL of the job's own page, which shows the same apply button as the detail pane."""
+    return urljoin(filters.get("indeed_url", INDEED_URL), "viewjob?" + urlencode({"jk": job_key}))
+
+@dataclass
+class SearchQuery:
+    """One search of the run: a job title and location, optionally one job type."""
+    job_title: str
+    location: str
+    job_type: Optional[str] = None
+
+    @property
+    def key(self):
+        """Name of the search in the checkpoint and the job index."""
+        return "|".join((self.job_title, self.location, self.job_type or ""))
+
+    def url(self, filters, start=0):
+        """Results page URL of this search, starting at result offset start."""
+        return build_search_url(dict(filters, job_title=self.job_title, location=self.location),
+                                start, self.job_type)
+
+def search_queries(filters):
+    """Return the searches of the run, one per title, location and job type.
+
+    Every "search=job title; location; job types" line adds searches (the
+    job types default to the job_type setting). Without such lines,
+    job_title and location describe the only search.
+    """
+    definitions = []
+    for line in filters.get("search", []):
+        parts = [part.strip() for part in line.split(";")]
+        if len(parts) < 2 or not parts[0]:
+            print(f"Ignoring search {line!r}: expected 'job title; location; job types'")
+            continue
+        job_types = split_setting(filters, "job_type")
+        if len(parts) > 2:
+            job_types = [job_type.strip() for job_type in parts[2].split(",") if job_type.strip()]
+        definitions.append((parts[0], parts[1], job_types))
+    if not definitions and filters.get("job_title"):
+        definitions.append((filters["job_title"], filters.get("location", ""), split_setting(filters, "job_type")))
+    return [SearchQuery(job_title, location, job_type)
+            for job_title, location, job_types in definitions
+            for job_type in job_types or [None]]
+
+# Job card data Indeed embeds as JSON in every results page.
+JOB_CARDS_PAYLOAD = re.compile(r'window\.mosaic\.providerData\["mosaic-provider-jobcards"\]\s*=\s*')
+
+# Markers of the "Easily apply" label in the job card markup.
+INDEED_APPLY_MARKERS = ("indeedapply", "ialabel")
+INDEED_APPLY_TEXTS = ("einfach bewerben", "schnellbewerbung", "easily apply")
+
+@dataclass
+class JobListing:
+    """A job as shown on the results page, before anything was clicked."""
+    job_key: str
+    title: Optional[str] = None
+    company: Optional[str] = None
+    location: Optional[str] = None
+    posted: Optional[str] = None
+    posted_at: Optional[float] = None  # Unix time, if the page states it
+    indeed_apply: Optional[bool] = None  # None when the page does not say
+
+def _listings_from_payload(html):
+    """Parse the embedded job cards JSON, or return None if the page has none."""
+    match = JOB_CARDS_PAYLOAD.search(html)
+    if not match:
+        return None
     try:
-        wait = WebDriverWait(driver, 10)
-        
-        # Fill in job title
-        what_field = wait.until(EC.presence_of_element_located((By.ID, "text-input-what")))
-        what_field.clear()
-        what_field.send_keys(filters['job_title'])
-        
-        # Fill in location
-        where_field = driver.find_element(By.ID, "text-input-where")
-        where_field.clear()
-        where_field.send_keys(filters['location'])
-        
-        # Submit search
-        what_field.send_keys(Keys.RETURN)
-        time.sleep(3)  # Wait for results to load
-        
-        # German job type translations
-        job_type_translations = {
-            'full-time': 'vollzeit',
-            'part-time': 'teilzeit',
-            'contract': 'befristet',
-            'internship': 'praktikum'
-        }
-        
-        # Filter by job types if specified
-        if 'job_type' in filters:
-            job_types = [jtype.strip() for jtype in filters['job_type'].split(',')]
-            for job_type in job_types:
-                try:
-                    # Use German translation if available
-                    german_type = job_type_translations.get(job_type.lower(), job_type)
-                    job_type_button = wait.until(EC.element_to_be_clickable(
-                        (By.XPATH, f"//button[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{german_type}')]")
-                    ))
-                    highlight_element(driver, job_type_button)
-                    job_type_button.click()
-                    print(f"Applied filter: {german_type}")
-                    time.sleep(1)
-                except TimeoutException:
-                    print(f"Could not find job type filter for: {job_type} ({german_type})")
-                except Exception as e:
-                    print(f"Error applying job type filter {job_type}: {e}")
+        payload, _ = json.JSONDecoder().raw_decode(html, match.end())
+        results = payload["metaData"]["mosaicProviderJobCardsModel"]["results"]
+    except (ValueError, KeyError, TypeError):
+        return None
+    listings = []
+    for result in results:
+        if not result.get("jobkey"):
+            continue
+        pub_date = result.get("pubDate")
+        flags = [result[key] for key in ("indeedApplyEnabled", "indeedApplyable") if key in result]
+        listings.append(JobListing(
+            job_key=result["jobkey"],
+            title=result.get("displayTitle") or result.get("title"),
+            company=result.get("company"),
+            location=result.get("formattedLocation"),
+            posted=result.get("formattedRelativeTime"),
+            posted_at=pub_date / 1000 if isinstance(pub_date, (int, float)) else None,
+            indeed_apply=any(flags) if flags else None,
+        ))
+    return _unknown_without_apply_flags(listings)
 
+class _JobCardParser(HTMLParser):
+    """Single pass over the results markup collecting one JobListing per job card."""
+
+    VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input",
+                 "link", "meta", "source", "track", "wbr"}
+    FIELDS = {"company-name": "company", "text-location": "location",
+              "myJobsStateDate": "posted"}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.listings = []
+        self._depth = 0
+        self._card_depth = None
+        self._field = None
+        self._text = {}
+
+    def handle_starttag(self, tag, attrs):
+        if tag not in self.VOID_TAGS:
+            self._depth += 1
+        attrs = dict(attrs)
+        classes = attrs.get("class") or ""
+        if self._card_depth is None:
+            if "job_seen_beacon" in classes.split():
+                self._card_depth = self._depth
+                self.listings.append(JobListing(job_key=None, indeed_apply=False))
+            return
+        listing = self.listings[-1]
+        if attrs.get("data-jk") and not listing.job_key:
+            listing.job_key = attrs["data-jk"]
+        if tag == "span" and attrs.get("title") and not listing.title:
+            listing.title = attrs["title"].strip()
+        marker = " ".join((classes, attrs.get("data-testid") or "")).lower()
+        if any(flag in marker for flag in INDEED_APPLY_MARKERS):
+            listing.indeed_apply = True
+        field = self.FIELDS.get(attrs.get("data-testid"))
+        if field and self._field is None and tag not in self.VOID_TAGS:
+            self._field = (field, self._depth)
+            self._text[field] = []
+
+    def handle_endtag(self, tag):
+        if tag in self.VOID_TAGS:
+            return
+        if self._field and self._depth == self._field[1]:
+            field = self._field[0]
+            setattr(self.listings[-1], field, " ".join("".join(self._text[field]).split()) or None)
+            self._field = None
+        if self._card_depth is not None and self._depth == self._card_depth:
+            self._card_depth = None
+            self._field = None
+        self._depth -= 1
+
+    def handle_data(self, data):
+        if self._card_depth is None:
+            return
+        if self._field:
+            self._text[self._field[0]].append(data)
+        if any(text in data.lower() for text in INDEED_APPLY_TEXTS):
+            self.listings[-1].indeed_apply = True
+
+def _listings_from_markup(html):
+    """Parse the job cards from the results markup."""
+    parser = _JobCardParser()
+    parser.feed(html)
+    parser.close()
+    return _unknown_without_apply_flags([listing for listing in parser.listings if listing.job_key])
+
+def _unknown_without_apply_flags(listings):
+    """Mark the apply type of all listings unknown if none of them is flagged as Indeed Apply.
+
+    Without a single flag the page format probably changed, so the detail
+    pane decides instead of every job being skipped as not Easy Apply.
+    """
+    if not any(listing.indeed_apply for listing in listings):
+        for listing in listings:
+            listing.indeed_apply = None
+    return listings
+
+def parse_results_page(html):
+    """Return the JobListings of a results page, preferring the embedded JSON."""
+    listings = _listings_from_payload(html)
+    if listings is None:
+        listings = _listings_from_markup(html)
+    return listings
+
+def extract_listings(driver):
+    """Read every job on the current results page without clicking anything."""
+    try:
+        return parse_results_page(driver.page_source)
     except Exception as e:
-        print(f"Error during job search: {e}")
+        print(f"Error extracting job listings: {e}")
+        return []
+
+def find_job_card(driver, job_key):
+    """Return the clickable title link of the job card with job_key."""
+    return driver.find_element(By.CSS_SELECTOR, f".job_seen_beacon [data-jk='{job_key}']")
+
+# Clickable title links of all job cards on the page, keyed by job key
+JOB_CARDS_JS = """
+var cards = {};
+document.querySelectorAll('.job_seen_beacon [data-jk]').forEach(function (link) {
+    cards[link.getAttribute('data-jk')] = link;
+});
+return cards;
+"""
+
+def resolve_job_cards(driver):
+    """Return the clickable title links of all job cards by job key, in one round trip."""
+    try:
+        return driver.execute_script(JOB_CARDS_JS) or {}
+    except Exception as e:
+        print(f"Error resolving job cards: {e}")
+        return {}
+
+# Relative posting times on job cards ("vor 3 Tagen", "30+ days ago", "Heute")
+POSTED_DAYS = re.compile(r"(\d+)\+?\s*(?:tag|day)", re.IGNORECASE)
+POSTED_TODAY = re.compile(r"heute|today|gerade|just posted|stunde|hour", re.IGNORECASE)
+WORDS = re.compile(r"\w+")
+
+class JobFilter:
+    """Accepts or rejects a job from the metadata on its card, before anything is clicked.
+
+    The rules are compiled once: keywords into a set of word sequences that
+    is probed with the n-grams of the title, regexes into one alternation per
+    kind, companies into a set. check() then costs microseconds per card,
+    also with hundreds of rules.
+    """
+
+    def __init__(self):
+        self.include_words = self.exclude_words = ({}, 0)
+        self.include_regex = self.exclude_regex = (None, [])
+        self.companies = set()
+        self.locations = []
+        self.max_age = None
+        self.active = False
+
+    def configure(self, filters):
+        """Compile the filter rules from the filters file."""
+        self.include_words = self._phrases(split_setting(filters, "include_keywords"))
+        self.exclude_words = self._phrases(split_setting(filters, "exclude_keywords"))
+        self.include_regex = self._regex(filters.get("include_regex", []))
+        self.exclude_regex = self._regex(filters.get("exclude_regex", []))
+        self.companies = {self._normalize(company) for company in split_setting(filters, "exclude_companies")}
+        self.locations = [location.casefold() for location in split_setting(filters, "locations")]
+        days = filters.get("max_age_days")
+        self.max_age = float(days) * 86400 if days else None
+        self.active = bool(self.include_words[0] or self.exclude_words[0] or self.include_regex[0]
+                           or self.exclude_regex[0] or self.companies or self.locations or self.max_age)
+
+    @staticmethod
+    def _normalize(text):
+        return " ".join(WORDS.findall(text.casefold()))
+
+    @staticmethod
+    def _phrases(keywords):
+        """Map each keyword's word sequence to the keyword; also return the longest length."""
+        phrases = {tuple(WORDS.findall(keyword.casefold())): keyword for keyword in keywords}
+        phrases.pop((), None)
+        return phrases, max(map(len, phrases), default=0)
+
+    @staticmethod
+    def _regex(patterns):
+        """Compile the valid patterns into one alternation; also return them compiled one by one.
+
+        Without capturing groups or IGNORECASE, re can skip ahead on the
+        first characters of the alternatives, so patterns are matched
+        against the lower-cased title instead.
+        """
+        valid = []
+        for pattern in patterns:
+            try:
+                # Checked as part of a larger expression, which rules out global flags like (?i)
+                re.compile(f"(?:{pattern})")
+                valid.append(pattern)
+            except re.error as e:
+                print(f"Ignoring invalid filter regex {pattern!r}: {e}")
+        if not valid:
+            return None, []
+        alternation = re.compile("|".join(f"(?:{pattern})" for pattern in valid))
+        return alternation, [re.compile(pattern) for pattern in valid]
+
+    @staticmethod
+    def _find_phrase(compiled, words):
+        phrases, longest = compiled
+        for start in range(len(words)):
+            for size in range(1, min(longest, len(words) - start) + 1):
+                keyword = phrases.get(tuple(words[start:start + size]))
+                if keyword:
+                    return keyword
+        return None
+
+    @staticmethod
+    def _find_regex(compiled, text):
+        alternation, patterns = compiled
+        if not alternation or not alternation.search(text):
+            return None
+        # Only a hit pays for finding out which pattern it was
+        return next(pattern.pattern for pattern in patterns if pattern.search(text))
+
+    def posted_age(self, listing):
+        """Age of the posting in seconds, from its timestamp or the relative date text."""
+        if listing.posted_at is not None:
+            return time.time() - listing.posted_at
+        posted = listing.posted or ""
+        days = POSTED_DAYS.search(posted)
+        if days:
+            return int(days.group(1)) * 86400
+        return 0.0 if POSTED_TODAY.search(posted) else None
+
+    def check(self, listing):
+        """Return (keep, reason) for the job behind listing."""
+        title = (listing.title or "").casefold()
+        if listing.company and self._normalize(listing.company) in self.companies:
+            return False, "company is blocked"
+        words = WORDS.findall(title)
+        keyword = self._find_phrase(self.exclude_words, words)
+        if keyword:
+            return False, f"title contains excluded keyword '{keyword}'"
+        pattern = self._find_regex(self.exclude_regex, title)
+        if pattern:
+            return False, f"title matches excluded pattern '{pattern}'"
+        if self.include_words[0] or self.include_regex[0]:
+            match = self._find_phrase(self.include_words, words) or self._find_regex(self.include_regex, title)
+            if not match:
+                return False, "title matches no included keyword or pattern"
+        if self.locations and listing.location:
+            location = listing.location.casefold()
+            if not any(allowed in location for allowed in self.locations):
+                return False, f"location {listing.location} is not wanted"
+        if self.max_age:
+            age = self.posted_age(listing)
+            if age is not None and age > self.max_age:
+                return False, f"posted {age / 86400:.0f} days ago"
+        return True, "matches the filters"
+
+job_filter = JobFilter()
+
+# List of common pop-up selectors (more can be added with popup_selectors)
+POPUP_SELECTORS = [
+    "[class*='popup-close']",
+    "[class*='close-button']",
+    "[class*='modal-close']",
+    "[aria-label='Close']",
+    "[class*='newsletter'] button[class*='close']",
+    ".icl-CloseButton",
+    "#popover-x",
+    "#popover-foreground .popover-x-button-close"
+]
+
+# Installs a MutationObserver that clicks visible close buttons as soon as a
+# popup appears, checking at most once per animation frame and clicking each
+# button only once. Evaluates to {document, dismissed}: an id of the document
+# and the number of popups dismissed in it so far, or to {skipped: true} in
+# an apply form, which is left alone since its "Close" buttons belong to the
+# form. The %s are the JSON selector list and the apply form URL pattern.
+POPUP_GUARD_JS = """(function (selectors, applyForm) {
+    if (new RegExp(applyForm, 'i').test(location.href)) return {skipped: true};
+    var guard = window.__popupGuard;
+    if (guard) return {document: guard.id, dismissed: guard.dismissed};
+    guard = window.__popupGuard = {id: Date.now().toString(36) + Math.random().toString(36).slice(2),
+                                   dismissed: 0, scheduled: false};
+    var clicked = new WeakSet();
+    function sweep() {
+        guard.scheduled = false;
+        selectors.forEach(function (selector) {
+            document.querySelectorAll(selector).forEach(function (el) {
+                var style = window.getComputedStyle(el);
+                if (!clicked.has(el) && el.getClientRects().length > 0 && style.visibility !== 'hidden') {
+                    clicked.add(el);
+                    el.click();
+                    guard.dismissed += 1;
+                }
+            });
+        });
+    }
+    function schedule() {
+        if (guard.scheduled) return;
+        guard.scheduled = true;
+        window.requestAnimationFrame(sweep);
+    }
+    function observe() {
+        new MutationObserver(schedule).observe(document.documentElement, {
+            childList: true, subtree: true, attributes: true,
+            attributeFilter: ['class', 'style', 'hidden', 'open']
+        });
+        schedule();
+    }
+    if (document.documentElement) observe();
+    else document.addEventListener('readystatechange', observe, {once: true});
+    return {document: guard.id, dismissed: guard.dismissed};
+})(%s, %s)"""
+
+# URLs of the Easy Apply form, whether in its own window or in the results tab
+APPLY_FORM_URL_PATTERN = r"smartapply\.indeed\.com|/indeedapply/|/apply\b"
+
+# "dismissed" counts the popups of the whole run, "documents" the last count
+# read from each recent document (tabs and page loads each have their own)
+popup_guard = {"selectors": list(POPUP_SELECTORS), "source": None, "dismissed": 0, "documents": {}}
+POPUP_GUARD_DOCUMENTS = 20
+
+def probe_buttons(driver, selectors):
+    """Return a de-duplicated snapshot of the buttons matching selectors in one round trip."""
+    return driver.execute_script(BUTTON_PROBE_JS, selectors)
+
+def find_easy_apply_button(driver):
+    """Return the snapshot entry of the Easy Apply button, or None."""
+    # Probe the selectors that found the button most often first, the catch-all last
+    start = time.perf_counter()
+    selectors = locators.rank("easy_apply", EASY_APPLY_SELECTORS) + [EASY_APPLY_FALLBACK_SELECTOR]
+    buttons = probe_buttons(driver, selectors)
+    elapsed = time.perf_counter() - start
+    print(f"Found {len(buttons)} buttons to check")
+    for button in buttons:
+        if not button["visible"] or not button["text"]:
+            continue
+        # If EITHER color OR text matches, we found our button!
+        if (any(color in button["background"] for color in EASY_APPLY_COLORS) or
+                "schnellbewerbung" in button["text"]):
+            print(f"Found matching button with color: {button['background']} and text: {button['text']}")
+            for selector in selectors[:selectors.index(button["selector"])]:
+                locators.record("easy_apply", selector, False, elapsed)
+            if button["selector"] != EASY_APPLY_FALLBACK_SELECTOR:
+                locators.record("easy_apply", button["selector"], True, elapsed)
+            return button
+    return None
 
 def is_easy_apply(driver):
     """Check if the job has Indeed's Easy Apply button (both English and German)."""
     try:
-        # Try multiple ways to find the button (just as helpers to locate potential buttons)
-        buttons = []
-        selectors = [
-            (By.ID, "indeedApplyButton"),
-            (By.CSS_SELECTOR, "button[class*='css-km0m34']"),
-            (By.CSS_SELECTOR, "button[aria-label*='Schnellbewerbung']"),
-            (By.CSS_SELECTOR, "button[aria-label*='Quick Apply']"),
-            (By.CSS_SELECTOR, "button")  # Fallback to check all buttons
-        ]
-        
         print("\nChecking for Easy Apply button...")
-        # Collect all potential buttons
-        for by, selector in selectors:
-            try:
-                elements = driver.find_elements(by, selector)
-                buttons.extend(elements)
-            except:
-                continue
-                
-        print(f"Found {len(buttons)} buttons to check")
-        
-        # Check each button for either criteria: color OR text
-        for button in buttons:
-            if not button.is_displayed():
-                continue
-                
-            try:
-                # Check the color
-                bg_color = button.value_of_css_property("background-color")
-                print(f"Button background color: {bg_color}")
-                
-                # Check the text
-                button_text = button.text.lower()
-                if not button_text:
-                    try:
-                        wrapper = button.find_element(By.CLASS_NAME, "jobsearch-IndeedApplyButton-contentWrapper")
-                        button_text = wrapper.text.lower()
-                    except:
-                        try:
-                            span = button.find_element(By.CSS_SELECTOR, "span.jobsearch-IndeedApplyButton-newDesign")
-                            button_text = span.text.lower()
-                        except:
-                            continue
-                
-                print(f"Button text: {button_text}")
-                
-                # If EITHER color OR text matches, we found our button!
-                if ("rgb(37, 87, 167)" in bg_color or "#2557a7" in bg_color or 
-                    "schnellbewerbung" in button_text):
-                    print("Found matching button!")
-                    return True
-            except Exception as e:
-                print(f"Error checking button: {e}")
-                continue
-        
+        if find_easy_apply_button(driver):
+            return True
         print("No matching button found")
         return False
     except Exception as e:
         print(f"Error checking for easy apply: {e}")
         return False
 
+class LocatorStats:
+    """Hit and miss counts and latency of locator strategies, kept per context.
+
+    Strategies are tried best first. Every update decays the counts of the
+    context, so the ranking follows changes in Indeed's markup. The numbers
+    are saved to a JSON file and reused by the next run.
+    """
+
+    def __init__(self, decay=0.95):
+        self.decay = decay
+        self.path = None
+        self.stats = {}
+
+    def load(self, path):
+        """Load statistics saved by an earlier run."""
+        self.path = path
+        try:
+            with open(path, "r") as file:
+                self.stats = json.load(file)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            print(f"Could not read locator statistics from {path}: {e}")
+
+    def save(self):
+        """Write the statistics to the file they were loaded from."""
+        if not self.path:
+            return
+        try:
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, "w") as file:
+                json.dump(self.stats, file, indent=2)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            print(f"Could not save locator statistics: {e}")
+
+    def score(self, context, name):
+        """Smoothed success rate of a strategy; unknown strategies score 0.5."""
+        entry = self.stats.get(context, {}).get(name)
+        if not entry:
+            return 0.5
+        return (entry["hits"] + 1) / (entry["hits"] + entry["misses"] + 2)
+
+    def rank(self, context, names):
+        """Return names ordered by success rate, keeping the given order on ties."""
+        return sorted(names, key=lambda name: -self.score(context, name))
+
+    def record(self, context, name, hit, elapsed):
+        """Count a hit or miss of a strategy and how long it took."""
+        context_stats = self.stats.setdefault(context, {})
+        for entry in context_stats.values():
+            entry["hits"] *= self.decay
+            entry["misses"] *= self.decay
+        entry = context_stats.setdefault(name, {"hits": 0.0, "misses": 0.0, "ms": elapsed * 1000})
+        entry["hits" if hit else "misses"] += 1
+        entry["ms"] = 0.8 * entry["ms"] + 0.2 * elapsed * 1000
+
+locators = LocatorStats()
+
 def highlight_element(driver, element):
-    """Highlight an element before clicking it."""
+    """Highlight an element before clicking it (skipped by the "fast" wait profile)."""
+    if not wait_settings["highlight"]:
+        return
     try:
         # Move mouse to element with visual feedback
         actions = ActionChains(driver)
@@ -143,193 +1020,548 @@ def highlight_element(driver, element):
         actions.perform()
         
         # Add a brief pause to make the movement visible
-        time.sleep(0.5)
+        pause(0.5)
         
         # Optional: Change element background color for visibility
         driver.execute_script("arguments[0].style.backgroundColor = 'yellow'", element)
-        time.sleep(0.5)
+        pause(0.5)
         driver.execute_script("arguments[0].style.backgroundColor = ''", element)
     except:
         pass  # If highlighting fails, continue without it
 
-def apply_to_job(driver):
-    """Apply to a job using Indeed Easy Apply/Schnellbewerbung."""
-    try:
-        # Try to find the button using the same successful selectors from is_easy_apply
-        apply_button = None
-        
-        # First try the ID
+# List of button text to look for (both German and English)
+CONTINUE_BUTTON_TEXTS = [
+    'weiter',  # Further
+    'fortfahren',  # Continue
+    'fortsetzung',  # Continue
+    'fortsetzen',  # Continue
+    'next',
+    'continue',
+    'submit',
+    'apply',
+    'senden',  # Send
+    'bewerben',  # Apply
+    'bewerbung absenden',  # Send application
+    'jetzt bewerben',  # Apply now
+    'trotzdem bewerben'  # Apply anyway
+]
+
+def find_flex_weiter_button(driver):
+    """Special check for "Weiter" button with display: flex."""
+    for button in probe_buttons(driver, ["button[type='button']"]):
+        if (button["visible"] and button["enabled"] and
+                button["display"] == 'flex' and button["text"] == 'weiter'):
+            return button["element"]
+    return None
+
+def text_button_finder(button_text):
+    """Return a strategy that finds a visible, enabled element containing button_text."""
+    def find(driver):
+        buttons = driver.find_elements(By.XPATH,
+            f"//*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{button_text}')]")
+        for button in buttons:
+            if button.is_displayed() and button.is_enabled():
+                return button
+        return None
+    return find
+
+# Strategies for the button that advances an apply form step, in default order
+FORM_STEP_STRATEGIES = {"flex weiter": find_flex_weiter_button}
+FORM_STEP_STRATEGIES.update((text, text_button_finder(text)) for text in CONTINUE_BUTTON_TEXTS)
+
+# Every fillable field of the current form step with its question. Radio
+# buttons and checkboxes are grouped into one field with their options.
+FORM_FIELDS_JS = """
+function clean(text) { return (text || '').replace(/\\s+/g, ' ').trim(); }
+function labelOf(el) {
+    var text = '';
+    if (el.id) {
+        var label = document.querySelector('label[for="' + CSS.escape(el.id) + '"]');
+        if (label) text = label.innerText;
+    }
+    if (!text && el.closest('label')) text = el.closest('label').innerText;
+    if (!text && el.getAttribute('aria-labelledby')) {
+        text = el.getAttribute('aria-labelledby').split(' ').map(function (id) {
+            var node = document.getElementById(id);
+            return node ? node.innerText : '';
+        }).join(' ');
+    }
+    return clean(text || el.getAttribute('aria-label') || el.placeholder || el.name);
+}
+function questionOf(el) {
+    var group = el.closest('fieldset, [role="radiogroup"], [role="group"]');
+    if (!group) return labelOf(el);
+    var legend = group.querySelector('legend');
+    if (legend) return clean(legend.innerText);
+    if (group.getAttribute('aria-labelledby')) {
+        var node = document.getElementById(group.getAttribute('aria-labelledby').split(' ')[0]);
+        if (node) return clean(node.innerText);
+    }
+    return clean(group.getAttribute('aria-label')) || labelOf(el);
+}
+var fields = [], groups = {};
+document.querySelectorAll('input, select, textarea').forEach(function (el) {
+    var kind = (el.type || el.tagName).toLowerCase();
+    if (['hidden', 'submit', 'button', 'file', 'image', 'reset'].indexOf(kind) !== -1) return;
+    var required = el.required || el.getAttribute('aria-required') === 'true';
+    if (kind === 'radio' || kind === 'checkbox') {
+        var key = kind + ':' + (el.name || questionOf(el));
+        var group = groups[key];
+        if (!group) {
+            group = groups[key] = {kind: kind, label: questionOf(el), required: false, filled: false, options: []};
+            fields.push(group);
+        }
+        group.required = group.required || required;
+        group.filled = group.filled || el.checked;
+        group.options.push({element: el, text: labelOf(el)});
+        return;
+    }
+    if (!el.getClientRects().length || el.disabled || el.readOnly) return;
+    fields.push({
+        kind: kind,
+        element: el,
+        label: labelOf(el),
+        required: required,
+        filled: el.tagName === 'SELECT' ? el.selectedIndex > 0 : !!el.value,
+        options: el.tagName === 'SELECT' ? Array.prototype.map.call(el.options, function (option) {
+            return {value: option.value, text: clean(option.text)};
+        }) : []
+    });
+});
+return fields;
+"""
+
+# Sets all values of a step at once through the native setters and fires the
+# events frameworks listen to; radio buttons and checkboxes are clicked.
+FILL_FIELDS_JS = """
+arguments[0].forEach(function (entry) {
+    var el = entry[0], value = entry[1];
+    if (el.type === 'radio' || el.type === 'checkbox') {
+        if (!el.checked) el.click();
+        return;
+    }
+    var proto = el.tagName === 'SELECT' ? HTMLSelectElement.prototype
+        : el.tagName === 'TEXTAREA' ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+    Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, value);
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+});
+"""
+
+# Words that say nothing about which question is asked
+QUESTION_STOP_WORDS = {
+    "a", "an", "and", "are", "do", "does", "for", "have", "how", "in", "is", "many", "much", "of", "on",
+    "or", "the", "to", "what", "which", "with", "you", "your", "please", "select", "enter",
+    "bitte", "das", "der", "die", "ein", "eine", "haben", "ihr", "ihre", "ist", "mit", "sie",
+    "sind", "und", "viele", "was", "welche", "welcher", "wie", "zu", "geben", "auf",
+}
+# Qualifiers such as "(brutto/Jahr)" or "(optional)"
+QUESTION_ASIDES = re.compile(r"\([^)]*\)")
+YES_ANSWERS = {"yes", "ja", "true"}
+NO_ANSWERS = {"no", "nein", "false"}
+
+class AnswerStore:
+    """Answers to screening questions, found by the wording of the question.
+
+    The answers file has "question = answer" lines, in German, English or
+    both. Questions are reduced to their content words and indexed by word;
+    a lookup scores the answers sharing a word by the weighted overlap of
+    the two word sets. Words missing from the index count as their closest
+    indexed word, so "Berufserfahrung" still finds "Erfahrung". An answer
+    also has to have nearly all of its own words in the question, so
+    "Rust experience" does not pass for "Python experience".
+    """
+
+    MIN_SCORE = 0.6
+    MIN_COVERAGE = 0.8
+
+    def __init__(self):
+        self.entries = []
+        self.index = {}
+        self.weights = {}
+        self.close_words = {}
+        self.logged = set()
+        self.log_path = None
+
+    @staticmethod
+    def words(text):
+        return {word for word in WORDS.findall(QUESTION_ASIDES.sub(" ", text.casefold()))
+                if word not in QUESTION_STOP_WORDS and not word.isdigit()}
+
+    def load(self, path, log_path=None):
+        """Read the answers file and prepare the word index; log_path collects unanswered questions."""
+        self.log_path = log_path
         try:
-            apply_button = driver.find_element(By.ID, "indeedApplyButton")
-            if apply_button.is_displayed() and "schnellbewerbung" in apply_button.text.lower():
-                print("Found button by ID")
-        except:
+            with open(path, encoding="utf-8") as file:
+                for line in file:
+                    if "=" in line and not line.strip().startswith("#"):
+                        question, answer = (part.strip() for part in line.split("=", 1))
+                        if answer and self.words(question):
+                            self.entries.append((self.words(question), answer))
+        except FileNotFoundError:
             pass
-            
-        # If not found, try by class and color
-        if not apply_button:
+        for number, (words, _) in enumerate(self.entries):
+            for word in words:
+                self.index.setdefault(word, []).append(number)
+        count = len(self.entries)
+        self.weights = {word: math.log(1 + count / len(numbers)) for word, numbers in self.index.items()}
+        if log_path and os.path.exists(log_path):
+            with open(log_path, encoding="utf-8") as file:
+                self.logged = {frozenset(self.words(line.split("=", 1)[0])) for line in file}
+
+    def _indexed(self, word):
+        if word in self.index:
+            return word
+        if word not in self.close_words:
+            close = difflib.get_close_matches(word, self.weights, n=1, cutoff=0.75)
+            self.close_words[word] = close[0] if close else None
+        return self.close_words[word]
+
+    def lookup(self, question):
+        """Return the stored answer for question, or None if none is close enough."""
+        words = {self._indexed(word) or word for word in self.words(question)}
+        candidates = {number for word in words for number in self.index.get(word, ())}
+        best, best_score = None, self.MIN_SCORE
+        for number in candidates:
+            stored, answer = self.entries[number]
+            shared = sum(self.weights[word] for word in words & stored)
+            own = sum(self.weights[word] for word in stored)
+            score = 2 * shared / (sum(self.weights.get(word, 1.0) for word in words) + own)
+            if score >= best_score and shared >= self.MIN_COVERAGE * own:
+                best, best_score = answer, score
+        return best
+
+    def log_unanswered(self, questions):
+        """Append questions not logged before to the log, ready to be answered there."""
+        new = []
+        for question in questions:
+            key = frozenset(self.words(question))
+            if key not in self.logged:
+                print(f"Unanswered question: {question}")
+                self.logged.add(key)
+                new.append(question)
+        if new and self.log_path:
             try:
-                buttons = driver.find_elements(By.CSS_SELECTOR, "button[class*='css-km0m34']")
-                for button in buttons:
-                    if button.is_displayed():
-                        bg_color = button.value_of_css_property("background-color")
-                        button_text = button.text.lower()
-                        
-                        # Check for either blue color or Schnellbewerbung text
-                        if ("rgb(37, 87, 167)" in bg_color or "#2557a7" in bg_color or 
-                            "schnellbewerbung" in button_text):
-                            apply_button = button
-                            print(f"Found button with color: {bg_color} and text: {button_text}")
-                            break
-            except Exception as e:
-                print(f"Error finding button by class/color: {e}")
-                
-        if not apply_button:
-            print("Could not find apply button")
+                with open(self.log_path, "a", encoding="utf-8") as file:
+                    file.writelines(f"{question} = \n" for question in new)
+            except OSError as e:
+                print(f"Could not log unanswered questions: {e}")
+
+answers = AnswerStore()
+
+def choose_options(field, answer):
+    """Return the option elements of a choice field that match answer."""
+    chosen = []
+    for part in answer.split(",") if field["kind"] == "checkbox" else [answer]:
+        part = part.strip().casefold()
+        texts = [option["text"].casefold() for option in field["options"]]
+        for number, text in enumerate(texts):
+            if (text == part or text.startswith(part)
+                    or (part in YES_ANSWERS and text in YES_ANSWERS)
+                    or (part in NO_ANSWERS and text in NO_ANSWERS)):
+                chosen.append(field["options"][number])
+                break
+        else:
+            close = difflib.get_close_matches(part, texts, n=1, cutoff=0.6)
+            if close:
+                chosen.append(field["options"][texts.index(close[0])])
+    return chosen
+
+def field_values(field, answer):
+    """Return the [element, value] pairs that put answer into field; empty if it does not fit."""
+    if field["kind"] in ("radio", "checkbox"):
+        return [[option["element"], True] for option in choose_options(field, answer)]
+    if field["options"]:
+        return [[field["element"], option["value"]] for option in choose_options(field, answer)[:1]]
+    return [[field["element"], answer]]
+
+def fill_form_step(driver):
+    """Answer the empty fields of the current form step from the answer store, in one batch.
+
+    Return False if a required question has no stored answer (or none of its
+    options matches the answer); such questions are logged for the operator.
+    """
+    fields = driver.execute_script(FORM_FIELDS_JS) or []
+    fills, unanswered = [], []
+    for field in fields:
+        if field["filled"]:
+            continue
+        answer = answers.lookup(field["label"]) if field["label"] else None
+        values = field_values(field, answer) if answer is not None else []
+        if not values and field["required"]:
+            unanswered.append(field["label"] or field["kind"])
+        fills.extend(values)
+    if unanswered:
+        answers.log_unanswered(unanswered)
+        return False
+    if fills:
+        driver.execute_script(FILL_FIELDS_JS, fills)
+        print(f"Filled {len(fills)} form field(s) from the answer store")
+    return True
+
+class WindowRegistry:
+    """The browser windows of the session by role, and which one is current.
+
+    Roles are "results" (the results tab), "prefetch" (the next results
+    page), "apply:N" (the apply tabs of the pipeline) and "<role>:form" (the
+    form window an apply button opened from that tab). Every window switch
+    goes through the registry, so the bot never has to guess which handle
+    is which from the order of window_handles.
+    """
+
+    def __init__(self):
+        self.handles = {}
+        self.current = None
+        self.opening = None  # role waiting for the window its click opens
+
+    def reset(self, driver):
+        """Forget all windows; the current one becomes the results tab."""
+        self.handles = {"results": driver.current_window_handle}
+        self.current = "results"
+        self.opening = None
+
+    def switch(self, driver, role):
+        if self.current != role:
+            driver.switch_to.window(self.handles[role])
+            self.current = role
+
+    def open_tab(self, driver, role):
+        """Open a new tab for role and make it current."""
+        driver.switch_to.new_window("tab")
+        self.handles[role] = driver.current_window_handle
+        self.current = role
+
+    def adopt(self, driver, role, handle):
+        """Register a window the page opened itself under role and make it current."""
+        self.handles[role] = handle
+        self.current = None
+        self.switch(driver, role)
+
+    def rename(self, role, new_role):
+        self.handles[new_role] = self.handles.pop(role)
+        if self.current == role:
+            self.current = new_role
+
+    def close(self, driver, role, back_to="results"):
+        """Close the window of role, if it is open, and switch to back_to."""
+        if role in self.handles:
+            self.switch(driver, role)
+            del self.handles[role]
+            self.current = None
+            driver.close()
+        self.switch(driver, back_to)
+
+    def claim(self, role):
+        """Condition: no other tab waits for a window to open; reserves the next one for role.
+
+        Only one click may open a window at a time, so the window that
+        appears is known to belong to it.
+        """
+        def condition(driver):
+            if self.opening not in (None, role):
+                return False
+            self.opening = role
+            return True
+        return condition
+
+    def release(self, role):
+        if self.opening == role:
+            self.opening = None
+
+windows = WindowRegistry()
+
+def apply_flow(driver, apply_button, origin):
+    """The steps of one Easy Apply/Schnellbewerbung application, as a generator.
+
+    Clicks apply_button in the window of role origin and fills and advances
+    the form that opens, in a new window or in origin itself. Every wait is
+    yielded as a (name, condition) pair and gets the condition's value, or
+    False on timeout, sent back, so the same steps run inline (run_flow) or
+    in a background tab interleaved with the results tab (ApplyPipeline).
+    Returns True if the application went through. The form window is closed
+    and origin is current again at the end.
+    """
+    form = f"{origin}:form"
+    origin_url = None
+    in_new_window = False
+    try:
+        # A form that replaces the results page has to be navigated away from again
+        if origin == "results":
+            origin_url = driver.current_url
+        if not (yield ("window_claimed", windows.claim(origin))):
             return False
-            
         print("Clicking apply button...")
+        handles_before = set(driver.window_handles)
         highlight_element(driver, apply_button)
         apply_button.click()
-        time.sleep(2)
 
         # Switch to the new tab if opened
-        original_window = driver.current_window_handle
-        for window_handle in driver.window_handles:
-            if window_handle != original_window:
-                driver.switch_to.window(window_handle)
-                break
+        new_window = yield ("new_window_opened", new_window_opened(handles_before))
+        windows.release(origin)
+        if new_window and new_window != "same":
+            windows.adopt(driver, form, new_window)
+            in_new_window = True
+            block_requests(driver)
 
         # Wait for form to load
-        time.sleep(3)
-
-        # List of button text to look for (both German and English)
-        continue_buttons_text = [
-            'weiter',  # Further
-            'fortfahren',  # Continue
-            'fortsetzung',  # Continue
-            'fortsetzen',  # Continue
-            'next',
-            'continue',
-            'submit',
-            'apply',
-            'senden',  # Send
-            'bewerben',  # Apply
-            'bewerbung absenden',  # Send application
-            'jetzt bewerben',  # Apply now
-            'trotzdem bewerben'  # Apply anyway
-        ]
-
-        # Keep clicking continue buttons until we see success message or run out of buttons
+        yield ("apply_form_loaded", apply_form_loaded)
+        report_navigation(driver, "Apply form")
+
+        # Follow the form by its state fingerprint until it reports success or stops moving
+        state = apply_state(driver)
+        steps_seen = set()
         max_steps = 10  # Maximum number of form steps
         for step in range(max_steps):
             try:
-                # Look for success message
-                success_texts = [
-                    'bewerbung gesendet',  # Application sent
-                    'application submitted',
-                    'successfully submitted',
-                    'thank you for applying'
-                ]
-                
-                page_text = driver.page_source.lower()
-                if any(text in page_text for text in success_texts):
+                if state["success"]:
                     print("Application successfully submitted!")
-                    driver.close()  # Close the application tab
-                    driver.switch_to.window(original_window)  # Switch back to main window
                     return True
+                if state["step"] in steps_seen:
+                    print("Apply form came back to an earlier step, giving up on this job")
+                    return False
+                steps_seen.add(state["step"])
+
+                # Answer this step's questions; a question without an answer ends the flow
+                if not fill_form_step(driver):
+                    print("Form asks a question without a stored answer, giving up on this job")
+                    return False
 
                 # Try to find and click the next button
                 button_found = False
-                
-                # Special check for "Weiter" button with display: flex
-                try:
-                    weiter_buttons = driver.find_elements(By.CSS_SELECTOR, "button[type='button']")
-                    for button in weiter_buttons:
-                        if button.is_displayed() and button.is_enabled():
-                            display_style = driver.execute_script(
-                                "return window.getComputedStyle(arguments[0]).display", 
-                                button
-                            )
-                            if display_style == 'flex' and button.text.lower() == 'weiter':
-                                highlight_element(driver, button)
-                                button.click()
-                                print("Clicked 'Weiter' button")
-                                button_found = True
-                                time.sleep(2)
-                                break
-                except Exception as e:
-                    print(f"Error checking for Weiter button: {e}")
 
-                # If "Weiter" button not found, try other buttons
-                if not button_found:
-                    for button_text in continue_buttons_text:
-                        try:
-                            buttons = driver.find_elements(By.XPATH, 
-                                f"//*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{button_text}')]")
-                            
-                            for button in buttons:
-                                if button.is_displayed() and button.is_enabled():
-                                    highlight_element(driver, button)
-                                    button.click()
-                                    print(f"Clicked button: {button_text}")
-                                    button_found = True
-                                    time.sleep(2)
-                                    break
-                            if button_found:
-                                break
-                        except:
-                            continue
+                # Try the button strategies in the order that advanced the form most often
+                for strategy in locators.rank("form_step", list(FORM_STEP_STRATEGIES)):
+                    start = time.perf_counter()
+                    try:
+                        button = FORM_STEP_STRATEGIES[strategy](driver)
+                        if button is not None:
+                            highlight_element(driver, button)
+                            button.click()
+                    except Exception as e:
+                        print(f"Error trying button strategy {strategy}: {e}")
+                        button = None
+                    if button is None:
+                        locators.record("form_step", strategy, False, time.perf_counter() - start)
+                        continue
+                    print(f"Clicked button: {strategy}")
+                    button_found = True
+                    new_state = yield ("apply_step_advanced", apply_step_advanced(state))
+                    locators.record("form_step", strategy, bool(new_state) and new_state["step"] != state["step"],
+                                    time.perf_counter() - start)
+                    break
 
                 if not button_found:
                     print("No more buttons found")
-                    driver.close()
-                    driver.switch_to.window(original_window)
                     return False
 
+                # A click that changed nothing, or only brought up errors, will not do better when repeated
+                if not new_state or (new_state["step"] == state["step"] and not new_state["success"]):
+                    errors = "; ".join(new_state["errors"]) if new_state else ""
+                    print(f"Apply form did not move on{f' ({errors})' if errors else ''}, giving up on this job")
+                    return False
+                state = new_state
+
             except Exception as e:
                 print(f"Error in application step {step}: {e}")
-                driver.close()
-                driver.switch_to.window(original_window)
                 return False
 
         print("Reached maximum number of steps without completing application")
-        driver.close()
-        driver.switch_to.window(original_window)
         return False
 
     except Exception as e:
         print(f"Error during application: {e}")
+        return False
+    finally:
+        windows.release(origin)
         try:
-            driver.close()
-            driver.switch_to.window(driver.window_handles[0])
-        except:
-            pass
+            # A dead browser has no windows left to tidy up
+            if not watchdog.lost:
+                windows.close(driver, form, back_to=origin)
+                if origin_url and not in_new_window:
+                    driver.get(origin_url)
+        except Exception as e:
+            print(f"Could not close the apply window: {e}")
+
+def run_flow(driver, flow):
+    """Run a generator of waits such as apply_flow to its end, waiting in place; return its result."""
+    try:
+        pending = next(flow)
+        while True:
+            with tracer.span("apply_step"):
+                try:
+                    value = wait_for(driver, *pending)
+                except Exception as e:
+                    # Let the flow handle the error and clean up its windows
+                    pending = flow.throw(e)
+                else:
+                    pending = flow.send(value)
+    except StopIteration as done:
+        return done.value
+
+def apply_to_job(driver):
+    """Apply to a job using Indeed Easy Apply/Schnellbewerbung, from the results tab."""
+    # Find the button with the same snapshot is_easy_apply decided on
+    match = find_easy_apply_button(driver)
+    if not match:
+        print("Could not find apply button")
         return False
+    return run_flow(driver, apply_flow(driver, match["element"], "results"))
+
+def install_popup_guard(driver, filters):
+    """Install the popup guard in the current tab, now and for every later document.
+
+    The guard dismisses popups inside the page as soon as they appear. It
+    skips apply forms, also when one opens in the results tab itself, since
+    "Close" buttons there belong to the form.
+    """
+    popup_guard["selectors"] = POPUP_SELECTORS + split_setting(filters, "popup_selectors")
+    popup_guard["source"] = POPUP_GUARD_JS % (json.dumps(popup_guard["selectors"]), json.dumps(APPLY_FORM_URL_PATTERN))
+    register_popup_guard(driver)
+    close_popups(driver)
+
+def register_popup_guard(driver):
+    """Have the current tab run the popup guard in every document it loads."""
+    if not popup_guard["source"]:
+        return
+    try:
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": popup_guard["source"]})
+    except Exception as e:
+        print(f"Could not register popup guard for new documents: {e}")
+
+def count_dismissed_popups(document, dismissed):
+    """Report the popups the guard dismissed in document since it was last asked."""
+    documents = popup_guard["documents"]
+    new = dismissed - documents.pop(document, 0)
+    documents[document] = dismissed
+    if len(documents) > POPUP_GUARD_DOCUMENTS:
+        del documents[next(iter(documents))]
+    if new > 0:
+        popup_guard["dismissed"] += new
+        print(f"Popup guard dismissed {new} popup(s)")
 
 def close_popups(driver):
-    """Close any pop-ups that might appear."""
+    """Close any pop-ups that might appear.
+
+    With the popup guard installed this only reads its counter (installing it
+    again if the page was replaced), so it costs one round trip.
+    """
     try:
-        # List of common pop-up selectors (add more as needed)
-        popup_selectors = [
-            "[class*='popup-close']",
-            "[class*='close-button']",
-            "[class*='modal-close']",
-            "[aria-label='Close']",
-            "[class*='newsletter'] button[class*='close']",
-            ".icl-CloseButton",
-            "#popover-x",
-            "#popover-foreground .popover-x-button-close"
-        ]
-
-        for selector in popup_selectors:
+        if popup_guard["source"]:
+            page = driver.execute_script("return " + popup_guard["source"])
+            if page is not None:
+                if page.get("skipped"):
+                    return  # an apply form, nothing to close here
+                count_dismissed_popups(page["document"], page["dismissed"])
+                return
+
+        # Fallback sweep: one probe finds the visible close buttons of all selectors
+        for button in probe_buttons(driver, popup_guard["selectors"]):
+            if not button["visible"]:
+                continue
             try:
-                close_buttons = driver.find_elements(By.CSS_SELECTOR, selector)
-                for button in close_buttons:
-                    if button.is_displayed():
-                        highlight_element(driver, button)
-                        button.click()
-                        time.sleep(0.5)
+                highlight_element(driver, button["element"])
+                button["element"].click()
+                wait_for(driver, "popup_closed", element_gone(button["element"]))
             except:
                 continue
 
@@ -339,131 +1571,1419 @@ def close_popups(driver):
 def click_job_card(driver, job_card):
     """Safely click a job card with proper waiting and scrolling."""
     try:
-        # Scroll the job card into view
-        driver.execute_script("arguments[0].scrollIntoView(true);", job_card)
-        time.sleep(1)  # Wait for scroll to complete
+        # Scroll the job card into view (instant, so no wait is needed) and read
+        # its job key and what the detail pane currently shows
+        job_key, previous_signature = driver.execute_script(CARD_CLICK_JS, job_card, DETAIL_PANE_SELECTOR)
         
         # Wait for the card to be clickable
-        wait = WebDriverWait(driver, 10)
+        wait = WebDriverWait(driver, 10, poll_frequency=wait_settings["poll"])
         wait.until(EC.element_to_be_clickable(job_card))
         
         # Highlight and click
         highlight_element(driver, job_card)
         job_card.click()
-        time.sleep(2)  # Wait for job details to load
+        wait_for(driver, "detail_pane_changed", detail_pane_changed(job_key, previous_signature))
         return True
+    except StaleElementReferenceException:
+        # The caller holds the card from an earlier lookup and resolves it again
+        raise
     except Exception as e:
         print(f"Error clicking job card: {e}")
         return False
 
+# Error messages of a browser session that is gone for good
+SESSION_ERROR_MARKERS = (
+    "invalid session id",
+    "no such session",
+    "session deleted",
+    "chrome not reachable",
+    "disconnected:",
+    "connection refused",
+    "max retries exceeded",
+)
+
+class SessionLost(Exception):
+    """The browser session died or hung; only a new browser can continue."""
+
+def is_session_error(error):
+    """Return True if error means the browser session cannot be used anymore."""
+    if isinstance(error, (SessionLost, ConnectionError)):
+        return True
+    message = str(error).lower()
+    return any(marker in message for marker in SESSION_ERROR_MARKERS)
+
+def kill_browser(driver):
+    """Kill Chrome and chromedriver without sending them a command, which could hang too."""
+    try:
+        os.kill(driver.browser_pid, signal.SIGTERM)
+    except Exception:
+        pass
+    try:
+        driver.service.process.kill()
+    except Exception:
+        pass
+
+class SessionWatchdog:
+    """Watches the WebDriver commands of the current session for a dead or hung browser.
+
+    A command failing with a session error marks the session lost. A command
+    running longer than the timeout gets the browser killed from a background
+    thread, which makes the command fail as well. The loops call check() to
+    turn a lost session into SessionLost, since most steps only print errors.
+    """
+
+    def __init__(self):
+        self.driver = None
+        self.timeout = None
+        self.lost = False
+        self.command_started = None
+        self.stopped = threading.Event()
+        self.thread = None
+
+    def attach(self, driver, timeout):
+        """Watch driver, replacing any session watched before."""
+        self.stop()
+        self.driver = driver
+        self.timeout = timeout
+        self.lost = False
+        self.command_started = None
+        execute = driver.execute
+
+        def watched_execute(driver_command, params=None):
+            self.command_started = time.monotonic()
+            try:
+                return execute(driver_command, params)
+            except Exception as e:
+                if is_session_error(e):
+                    self.lost = True
+                raise
+            finally:
+                self.command_started = None
+
+        driver.execute = watched_execute
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, args=(driver, self.stopped), daemon=True)
+        self.thread.start()
+
+    def run(self, driver, stopped):
+        while not stopped.wait(1):
+            started = self.command_started
+            if started is not None and time.monotonic() - started > self.timeout:
+                print(f"Browser did not answer for {self.timeout:.0f}s, killing it")
+                self.lost = True
+                kill_browser(driver)
+                return
+
+    def check(self):
+        """Raise SessionLost if the watched session died or hung."""
+        if self.lost:
+            raise SessionLost("browser session lost")
+
+    def stop(self):
+        self.stopped.set()
+
+watchdog = SessionWatchdog()
+
 def retry_with_backoff(func, max_retries=3):
-    """Retry a function with exponential backoff."""
+    """Retry a function with exponential backoff.
+
+    Only transient page errors are retried. A lost session is raised as
+    SessionLost right away: the dead driver cannot recover, so the
+    supervisor has to start a new browser.
+    """
     for attempt in range(max_retries):
         try:
             return func()
+        except SessionLost:
+            raise
         except Exception as e:
-            if "invalid session" in str(e).lower():
-                if attempt == max_retries - 1:  # Last attempt
-                    raise  # Re-raise the last exception
-                time.sleep(2 ** attempt)  # Exponential backoff
+            if watchdog.lost or is_session_error(e):
+                raise SessionLost(str(e)) from e
+            if not isinstance(e, (StaleElementReferenceException, TimeoutException)):
+                raise  # Re-raise other exceptions immediately
+            if attempt == max_retries - 1:  # Last attempt
+                raise  # Re-raise the last exception
+            pause(2 ** attempt)  # Exponential backoff
+
+JOB_INDEX_SCHEMA = """
+PRAGMA journal_mode=WAL;
+CREATE TABLE IF NOT EXISTS jobs (
+    job_key TEXT PRIMARY KEY,
+    title TEXT,
+    company TEXT,
+    posted TEXT,
+    posted_at REAL,
+    easy_apply INTEGER,
+    outcome TEXT,
+    outcome_at REAL,
+    first_seen REAL NOT NULL,
+    updated REAL NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS searches (
+    query TEXT PRIMARY KEY,
+    last_run REAL NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS claims (
+    job_key TEXT PRIMARY KEY,
+    run TEXT NOT NULL,
+    claimed_at REAL NOT NULL
+) WITHOUT ROWID;
+"""
+
+# Takes job_key for a run, unless the same run already took it
+JOB_INDEX_CLAIM = """
+INSERT INTO claims (job_key, run, claimed_at) VALUES (?, ?, ?)
+ON CONFLICT(job_key) DO UPDATE SET run = excluded.run, claimed_at = excluded.claimed_at
+WHERE claims.run != excluded.run
+"""
+
+JOB_INDEX_UPSERT = """
+INSERT INTO jobs (job_key, title, company, posted, posted_at, easy_apply, outcome, outcome_at, first_seen, updated)
+VALUES (:job_key, :title, :company, :posted, :posted_at, :easy_apply, :outcome, :outcome_at, :now, :now)
+ON CONFLICT(job_key) DO UPDATE SET
+    title = COALESCE(excluded.title, title),
+    company = COALESCE(excluded.company, company),
+    posted = COALESCE(excluded.posted, posted),
+    posted_at = COALESCE(excluded.posted_at, posted_at),
+    easy_apply = COALESCE(excluded.easy_apply, easy_apply),
+    outcome = COALESCE(excluded.outcome, outcome),
+    outcome_at = COALESCE(excluded.outcome_at, outcome_at),
+    updated = excluded.updated
+"""
+
+class JobIndex:
+    """Persistent SQLite record of every job the bot inspected, keyed by Indeed job key.
+
+    Writes are queued and committed in batches by a background thread, so
+    recording an outcome never blocks the browser loop. The workers of a pool
+    share a run id and claim each job before opening it, so no two of them
+    apply to the same job.
+    """
+
+    # Outcomes that mean a job never needs to be clicked again
+    FINAL_OUTCOMES = ("applied", "not_easy_apply")
+
+    def __init__(self, path="jobs.sqlite3", batch_size=100, flush_interval=1.0, run=None):
+        self.path = path
+        self.run = run
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._pending = queue.Queue()
+        self._session_outcomes = {}
+        self._reader = self._connect()
+        self._reader.executescript(JOB_INDEX_SCHEMA)
+        self._migrate()
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer.start()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _migrate(self):
+        # Indexes written before posting times were kept lack their column
+        columns = {row["name"] for row in self._reader.execute("PRAGMA table_info(jobs)")}
+        if "posted_at" not in columns:
+            try:
+                with self._reader:
+                    self._reader.execute("ALTER TABLE jobs ADD COLUMN posted_at REAL")
+            except sqlite3.OperationalError:
+                pass  # Another worker of the pool added it first
+
+    def _write_loop(self):
+        conn = self._connect()
+        stopping = False
+        while not stopping:
+            batch = []
+            try:
+                batch.append(self._pending.get(timeout=self.flush_interval))
+                while len(batch) < self.batch_size:
+                    batch.append(self._pending.get_nowait())
+            except queue.Empty:
+                pass
+            if None in batch:
+                stopping = True
+                batch = [row for row in batch if row is not None]
+            if batch:
+                try:
+                    with conn:
+                        conn.executemany(JOB_INDEX_UPSERT, batch)
+                except sqlite3.Error as e:
+                    print(f"Error writing job index: {e}")
+        conn.close()
+
+    def record(self, job_key, title=None, company=None, posted=None, easy_apply=None, outcome=None,
+               posted_at=None):
+        """Queue an update for job_key; fields left as None keep their stored value.
+
+        posted is the relative date as the card shows it, posted_at the Unix
+        time of the posting if the page states it.
+        """
+        if not job_key:
+            return
+        now = time.time()
+        if outcome:
+            self._session_outcomes[job_key] = outcome
+        self._pending.put({
+            "job_key": job_key,
+            "title": title,
+            "company": company,
+            "posted": posted,
+            "posted_at": posted_at,
+            "easy_apply": None if easy_apply is None else int(easy_apply),
+            "outcome": outcome,
+            "outcome_at": now if outcome else None,
+            "now": now,
+        })
+
+    def lookup(self, job_key):
+        """Return what we know about job_key as a dict, or None."""
+        row = self._reader.execute("SELECT * FROM jobs WHERE job_key = ?", (job_key,)).fetchone()
+        return dict(row) if row else None
+
+    def claim(self, job_key):
+        """Take job_key for this run; return False if another worker of the run has it.
+
+        Committed right away, unlike record(). Without a run id there is
+        nobody to share jobs with and every claim succeeds.
+        """
+        if not self.run:
+            return True
+        with self._reader:
+            cursor = self._reader.execute(JOB_INDEX_CLAIM, (job_key, self.run, time.time()))
+        return cursor.rowcount == 1
+
+    def last_run(self, query):
+        """Start time of the last run that finished the search query, or None."""
+        row = self._reader.execute("SELECT last_run FROM searches WHERE query = ?", (query,)).fetchone()
+        return row["last_run"] if row else None
+
+    def finish_search(self, query, started):
+        """Record that a run started at started went through all new postings of query."""
+        with self._reader:
+            self._reader.execute("INSERT OR REPLACE INTO searches (query, last_run) VALUES (?, ?)",
+                                 (query, started))
+
+    def unseen(self, listings):
+        """Return how many of listings have no final outcome yet."""
+        return len(listings) - len(self.known(listing.job_key for listing in listings))
+
+    def known(self, job_keys):
+        """Return the subset of job_keys that already have a final outcome."""
+        job_keys = [key for key in job_keys if key]
+        known = {key for key in job_keys if self._session_outcomes.get(key) in self.FINAL_OUTCOMES}
+        if job_keys:
+            placeholders = ",".join("?" * len(job_keys))
+            rows = self._reader.execute(
+                f"SELECT job_key FROM jobs WHERE job_key IN ({placeholders}) "
+                f"AND outcome IN ({','.join('?' * len(self.FINAL_OUTCOMES))})",
+                (*job_keys, *self.FINAL_OUTCOMES),
+            )
+            known.update(row["job_key"] for row in rows)
+        return known
+
+    def close(self):
+        """Flush queued writes and close the index."""
+        self._pending.put(None)
+        self._writer.join()
+        self._reader.close()
+
+class Checkpoint:
+    """Position and counters of a run, saved after every job.
+
+    A run that crashed resumes every search at the results page it was on,
+    and after the last job it finished on the page shown last. Jobs queued
+    for the apply tabs count as finished for the position, so they are kept
+    as pending until their application is done, and queued again on resume.
+    The file belongs to one set of searches; changed searches start over.
+    """
+
+    def __init__(self, path, filters):
+        self.path = path
+        self.query = {key: filters.get(key) for key in ("job_title", "location", "job_type", "search")}
+        self.state = {"positions": {}, "page": None, "last_job_key": None, "done": [], "stats": None,
+                      "pending": []}
+
+    def load(self):
+        """Load the saved position of these searches; return True if there is one."""
+        try:
+            with open(self.path) as file:
+                data = json.load(file)
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as e:
+            print(f"Could not read checkpoint {self.path}: {e}")
+            return False
+        if data.get("query") != self.query:
+            print("Checkpoint belongs to other searches, starting over")
+            return False
+        self.state.update(data.get("state", {}))
+        return True
+
+    def save(self):
+        try:
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, "w") as file:
+                json.dump({"query": self.query, "state": self.state, "updated": time.time()}, file)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            print(f"Could not save checkpoint: {e}")
+
+    def resume_start(self, search, default):
+        """Return the offset to start the search at, or None if it was finished."""
+        if search in self.state["done"]:
+            return None
+        return self.state["positions"].get(search, default)
+
+    def start_page(self, search, start, listings):
+        """Record the page being processed and return its listings not handled yet."""
+        state = self.state
+        keys = [listing.job_key for listing in listings]
+        if state["page"] == [search, start] and state["last_job_key"] in keys:
+            listings = listings[keys.index(state["last_job_key"]) + 1:]
+            print(f"Resuming after job {state['last_job_key']}")
+        else:
+            state["last_job_key"] = None
+        state["page"] = [search, start]
+        state["positions"][search] = start
+        self.save()
+        return listings
+
+    def job_done(self, job_key, stats):
+        self.state["last_job_key"] = job_key
+        self.state["stats"] = dict(stats)
+        self.save()
+
+    def job_queued(self, listing):
+        """Keep listing as pending until its application in an apply tab is done."""
+        self.state["pending"].append(asdict(listing))
+        self.save()
+
+    def application_done(self, job_key, stats):
+        self.state["pending"] = [job for job in self.state["pending"] if job["job_key"] != job_key]
+        self.state["stats"] = dict(stats)
+        self.save()
+
+    def pending(self):
+        """Return the listings queued for the apply tabs but not applied to yet."""
+        return [JobListing(**job) for job in self.state["pending"]]
+
+    def search_done(self, search):
+        self.state["done"].append(search)
+        self.state["positions"].pop(search, None)
+        if self.state["page"] and self.state["page"][0] == search:
+            self.state["page"] = self.state["last_job_key"] = None
+        self.save()
+
+    def clear(self):
+        """Remove the checkpoint once all searches are done."""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+def record_application(job_index, listing, stats, applied):
+    """Count and record the outcome of an application to listing."""
+    fields = {"title": listing.title, "company": listing.company, "posted": listing.posted,
+              "posted_at": listing.posted_at}
+    if applied:
+        stats["applied"] += 1
+        print(f"Successfully applied! Total applications: {stats['applied']}")
+        job_index.record(listing.job_key, **fields, easy_apply=True, outcome="applied")
+    else:
+        stats["failed"] += 1
+        job_index.record(listing.job_key, **fields, easy_apply=True, outcome="failed")
+
+def queued_application(driver, filters, listing, origin):
+    """Apply to a queued job from the apply tab origin, as a generator like apply_flow.
+
+    Opens the job's own page, where the Easy Apply button is, and continues
+    with apply_flow. Returns None if the page offers no Easy Apply.
+    """
+    # Assigning location returns at once, the page loads while the results tab goes on
+    driver.execute_script("location.href = arguments[0]", build_job_url(filters, listing.job_key))
+    if not (yield ("job_page_loaded", job_page_loaded(listing.job_key))):
+        return False
+    report_navigation(driver, "Job page")
+    with tracer.span("popups"):
+        close_popups(driver)
+    match = find_easy_apply_button(driver)
+    if not match:
+        return None
+    return (yield from apply_flow(driver, match["element"], origin))
+
+@dataclass
+class Application:
+    """An application in progress in an apply tab of the pipeline."""
+    listing: JobListing
+    flow: Generator
+    waiting: tuple  # (name, condition) yielded by the flow
+    since: float  # when the wait started
+    window: str  # role of the window the flow waits in
+
+class ApplyPipeline:
+    """Applications running in their own tabs while the results tab keeps going.
+
+    The results tab qualifies the cards and pushes Easy Apply jobs into a
+    bounded queue; each apply tab takes the next job, opens its page and
+    goes through the form. All tabs share one driver: pump() checks the
+    wait every apply tab is in, without blocking, and moves on the tabs
+    whose page is ready, so the page loads of both sides overlap. Pushing
+    to a full queue pumps until there is room.
+    """
+
+    def __init__(self, driver, filters, job_index, stats, tabs=1, size=5, checkpoint=None):
+        self.driver = driver
+        self.filters = filters
+        self.job_index = job_index
+        self.stats = stats
+        self.checkpoint = checkpoint
+        self.size = max(1, size)
+        self.queue = deque()
+        self.running = {f"apply:{number}": None for number in range(max(1, tabs))}
+
+    def push(self, listing):
+        """Queue an Easy Apply job, first waiting for room while the queue is full."""
+        while len(self.queue) >= self.size:
+            if not self.pump():
+                pause(wait_settings["poll"])
+        self.queue.append(listing)
+        if self.checkpoint:
+            self.checkpoint.job_queued(listing)
+        self.pump()
+
+    def pump(self):
+        """Move every apply tab on as far as it gets without waiting; return True if one did.
+
+        Leaves the results tab current. A lost session raises SessionLost.
+        """
+        driver = self.driver
+        progressed = False
+        try:
+            for tab, application in self.running.items():
+                try:
+                    if application is None and self.queue:
+                        application = self.start(tab, self.queue.popleft())
+                    if application is not None:
+                        progressed |= self.advance(tab, application)
+                except SessionLost:
+                    raise
+                except Exception as e:
+                    if watchdog.lost or is_session_error(e):
+                        raise SessionLost(str(e)) from e
+                    print(f"Error in {tab}: {e}")
+        finally:
+            if not watchdog.lost:
+                windows.switch(driver, "results")
+        watchdog.check()
+        return progressed
+
+    def start(self, tab, listing):
+        if tab not in windows.handles:
+            windows.open_tab(self.driver, tab)
+            prepare_tab(self.driver)
+        windows.switch(self.driver, tab)
+        print(f"Applying to {listing.title} ({listing.company}) in {tab}")
+        application = Application(listing, queued_application(self.driver, self.filters, listing, tab),
+                                  None, time.perf_counter(), tab)
+        self.running[tab] = application
+        self.resume(tab, application, None)
+        return self.running[tab]
+
+    def advance(self, tab, application):
+        """Check the wait of the application once and resume it if it is over."""
+        name, condition = application.waiting
+        windows.switch(self.driver, application.window)
+        try:
+            value = condition(self.driver)
+        except Exception as e:
+            # A page in the middle of loading may fail the check; only a lost session ends the wait
+            if watchdog.lost or is_session_error(e):
+                raise
+            value = False
+        waited = time.perf_counter() - application.since
+        timed_out = not value and waited >= WAIT_CONDITIONS[name]["timeout"]
+        if not value and not timed_out:
+            return False
+        if timed_out:
+            print(f"Timed out waiting for {name}")
+        _record_wait(name, waited, WAIT_CONDITIONS[name]["legacy"], timed_out)
+        self.resume(tab, application, value)
+        return True
+
+    def resume(self, tab, application, value):
+        """Send value to the flow and run it to its next wait, or record its result."""
+        with tracer.span("apply_step", job_key=application.listing.job_key):
+            try:
+                application.waiting = application.flow.send(value)
+            except StopIteration as done:
+                self.finish(tab, application, done.value)
+                return
+            except Exception as e:
+                print(f"Error applying to {application.listing.job_key}: {e}")
+                self.finish(tab, application, False)
+                return
+        application.since = time.perf_counter()
+        application.window = windows.current
+
+    def finish(self, tab, application, applied):
+        listing = application.listing
+        self.running[tab] = None
+        if applied is None:
+            print(f"No Easy Apply on the page of {listing.title} ({listing.company})")
+            self.job_index.record(listing.job_key, listing.title, listing.company, listing.posted,
+                                  posted_at=listing.posted_at, easy_apply=False, outcome="not_easy_apply")
+        else:
+            record_application(self.job_index, listing, self.stats, applied)
+        if self.checkpoint:
+            self.checkpoint.application_done(listing.job_key, self.stats)
+
+    def drain(self):
+        """Wait until every queued application is finished."""
+        while self.queue or any(self.running.values()):
+            if not self.pump():
+                pause(wait_settings["poll"])
+
+    def close(self):
+        """Stop the running applications and close the apply tabs."""
+        for tab, application in self.running.items():
+            try:
+                if application is not None:
+                    application.flow.close()
+                windows.close(self.driver, f"{tab}:form", back_to=tab)
+                windows.close(self.driver, tab)
+            except Exception as e:
+                print(f"Could not close {tab}: {e}")
+        self.running = dict.fromkeys(self.running)
+        self.queue.clear()
+
+def process_job(driver, job_index, listing, cards, stats, apply_slots=None, pipeline=None):
+    """Open one job card and apply to it if it offers Easy Apply.
+
+    cards maps job keys to the card elements resolved for the page; it is
+    refreshed in place if the results list was re-rendered. apply_slots is an
+    optional semaphore limiting concurrent applications across the workers of
+    a pool. With a pipeline, Easy Apply jobs are queued for its apply tabs
+    instead of applied to here.
+    """
+    # Close any popups
+    with tracer.span("popups"):
+        close_popups(driver)
+    
+    # Try to click the job card safely
+    with tracer.span("card_click"):
+        try:
+            clicked = click_job_card(driver, cards.get(listing.job_key) or find_job_card(driver, listing.job_key))
+        except StaleElementReferenceException:
+            cards.update(resolve_job_cards(driver))
+            clicked = click_job_card(driver, cards.get(listing.job_key) or find_job_card(driver, listing.job_key))
+        if not clicked:
+            return
+    stats["inspected"] += 1
+    
+    # Close popups that might appear after clicking
+    with tracer.span("popups"):
+        close_popups(driver)
+    
+    # Check if it's an Easy Apply job
+    with tracer.span("easy_apply_check"):
+        easy_apply = retry_with_backoff(lambda: is_easy_apply(driver))
+    if easy_apply and pipeline:
+        print("Found Easy Apply job, queueing it")
+        pipeline.push(listing)
+    elif easy_apply:
+        print("Found Easy Apply job, attempting to apply...")
+        with apply_slots or nullcontext(), tracer.span("apply"):
+            applied = retry_with_backoff(lambda: apply_to_job(driver))
+        record_application(job_index, listing, stats, applied)
+    else:
+        print("Skipping non-Easy Apply job")
+        job_index.record(listing.job_key, listing.title, listing.company, listing.posted,
+                         posted_at=listing.posted_at, easy_apply=False, outcome="not_easy_apply")
+
+def process_results_page(driver, job_index, stats, apply_slots=None, listings=None, checkpoint=None,
+                         pipeline=None):
+    """Handle every job on the current results page and return its listings.
+
+    The listings are read from the page in one pass (unless the caller already
+    parsed them), so only jobs that offer Indeed Apply (or whose apply type
+    the page does not state) get clicked. The card elements are resolved once
+    and looked up by job key. With a pipeline, jobs the page marks as Indeed
+    Apply go to its queue without being clicked, and the apply tabs are
+    moved on after every job. A lost browser session raises SessionLost;
+    otherwise the checkpoint, if given, is saved after every job.
+    """
+    report_navigation(driver, "Results page")
+    if listings is None:
+        listings = extract_listings(driver)
+    print(f"Found {len(listings)} jobs on this page")
+    known_jobs = job_index.known(listing.job_key for listing in listings)
+    cards = resolve_job_cards(driver)
+    
+    for listing in listings:
+        try:
+            if listing.job_key in known_jobs:
+                print(f"Skipping already handled job {listing.job_key}")
+                stats["skipped"] += 1
+                continue
+            if listing.indeed_apply is False:
+                print(f"Skipping non-Easy Apply job: {listing.title} ({listing.company})")
+                stats["skipped"] += 1
+                job_index.record(listing.job_key, listing.title, listing.company, listing.posted,
+                                 posted_at=listing.posted_at, easy_apply=False, outcome="not_easy_apply")
+                continue
+            if job_filter.active:
+                keep, reason = job_filter.check(listing)
+                print(f"Filter {'keeps' if keep else 'skips'} {listing.title} ({listing.company}): {reason}")
+                if not keep:
+                    stats["skipped"] += 1
+                    job_index.record(listing.job_key, listing.title, listing.company, listing.posted,
+                                     posted_at=listing.posted_at, outcome="filtered")
+                    continue
+            if not job_index.claim(listing.job_key):
+                print(f"Skipping job {listing.job_key}, another worker has it")
+                stats["skipped"] += 1
                 continue
-            raise  # Re-raise other exceptions immediately
+            if pipeline and listing.indeed_apply:
+                stats["inspected"] += 1
+                pipeline.push(listing)
+                continue
+            with tracer.span("job", job_key=listing.job_key):
+                process_job(driver, job_index, listing, cards, stats, apply_slots, pipeline)
+        except SessionLost:
+            raise
+        except Exception as e:
+            print(f"Error processing job card: {e}")
+        finally:
+            if pipeline and not watchdog.lost:
+                pipeline.pump()
+            watchdog.check()
+        if checkpoint:
+            checkpoint.job_done(listing.job_key, stats)
+    return listings
+
+def is_enabled(filters, key, default=False):
+    """Return True if a yes/no setting in the filters is switched on."""
+    return filters.get(key, "true" if default else "").lower() in ("1", "true", "yes", "on")
+
+def split_setting(filters, key, default=()):
+    """Return a comma-separated setting from the filters as a list."""
+    if key not in filters:
+        return list(default)
+    return [value.strip() for value in filters[key].split(",") if value.strip()]
+
+def blocked_url_patterns(filters):
+    """Return the URL patterns lean mode blocks, from the defaults and the filters."""
+    patterns = []
+    for resource_type in split_setting(filters, "block_resources", LEAN_BLOCKED_RESOURCES):
+        patterns.extend(LEAN_BLOCKED_RESOURCES.get(resource_type, []))
+    patterns.extend(LEAN_BLOCKED_URLS)
+    patterns.extend(split_setting(filters, "block_urls"))
+    allowed = set(split_setting(filters, "allow_urls"))
+    return [pattern for pattern in dict.fromkeys(patterns) if pattern not in allowed]
+
+def block_requests(driver):
+    """Block lean mode's URL patterns in the current window through CDP."""
+    if not browser_settings["blocked_urls"]:
+        return
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": browser_settings["blocked_urls"]})
+    except Exception as e:
+        print(f"Could not block requests: {e}")
+
+def report_navigation(driver, label):
+    """Record and print page-load time and bytes transferred for the current page."""
+    try:
+        metrics = driver.execute_script(NAVIGATION_METRICS_JS)
+    except Exception as e:
+        print(f"Could not read navigation metrics: {e}")
+        return
+    if not metrics:
+        return
+    navigation_stats.append(metrics)
+    print(f"{label}: loaded in {metrics['load_ms'] / 1000:.2f}s, "
+          f"{metrics['bytes'] / 1024:.0f} KB in {metrics['requests']} requests")
+
+def print_navigation_report():
+    """Print average page-load time and transfer size over all navigations."""
+    if not navigation_stats:
+        return
+    count = len(navigation_stats)
+    load_ms = sum(metrics["load_ms"] for metrics in navigation_stats)
+    total_bytes = sum(metrics["bytes"] for metrics in navigation_stats)
+    print(f"\nNavigations: {count}, average load {load_ms / count / 1000:.2f}s, "
+          f"average transfer {total_bytes / count / 1024:.0f} KB, total {total_bytes / 1024 / 1024:.1f} MB")
+
+def driver_cache_path(filters):
+    """Path of the cached patched chromedriver for the configured Chrome version."""
+    path = os.path.join(filters.get("driver_cache", "driver_cache"),
+                        f"chromedriver-{filters.get('chrome_version', CHROME_VERSION)}")
+    return os.path.abspath(path + (".exe" if os.name == "nt" else ""))
+
+def cached_driver_path(filters):
+    """Return the patched chromedriver to reuse, or None if it has to be patched first.
+
+    driver_executable_path names a binary explicitly; otherwise the cache
+    holds one patched binary per Chrome major version.
+    """
+    if filters.get("driver_executable_path"):
+        return filters["driver_executable_path"]
+    path = driver_cache_path(filters)
+    return path if os.path.exists(path) else None
+
+def cache_driver(driver, filters):
+    """Keep the chromedriver undetected-chromedriver just patched for later starts."""
+    path = driver_cache_path(filters)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        shutil.copy2(driver.patcher.executable_path, temp_path)
+        os.replace(temp_path, path)
+        print(f"Cached patched chromedriver in {path}")
+    except (OSError, AttributeError) as e:
+        print(f"Could not cache chromedriver: {e}")
+
+def launch_browser(filters, multi_process=False):
+    """Start an undetected Chrome session.
+
+    multi_process must be set when several sessions run at once; it reuses
+    the chromedriver patched by the first session instead of patching again.
+    lean=true blocks images, fonts, media and trackers and caps the window size.
+    Single sessions keep their Chrome profile (profile_dir), so a browser
+    started again after a crash is still logged in.
+    """
+    lean = is_enabled(filters, "lean")
+    options = uc.ChromeOptions()
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    if lean:
+        options.add_argument(f"--window-size={filters.get('window_size', '1280,900')}")
+        if "image" in split_setting(filters, "block_resources", LEAN_BLOCKED_RESOURCES):
+            options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+        browser_settings["blocked_urls"] = blocked_url_patterns(filters)
+    else:
+        options.add_argument("--start-maximized")
+    profile_dir = None if multi_process else os.path.abspath(filters.get("profile_dir", "chrome_profile"))
+    # A cached binary is already patched and only read, so sessions can share it
+    driver_path = cached_driver_path(filters)
+    driver = uc.Chrome(options=options, version_main=int(filters.get("chrome_version", CHROME_VERSION)),
+                       user_multi_procs=multi_process and not driver_path,
+                       driver_executable_path=driver_path,
+                       headless=is_enabled(filters, "headless"), user_data_dir=profile_dir)
+    if not driver_path:
+        cache_driver(driver, filters)
+    if tracer.enabled:
+        tracer.instrument(driver)
+    windows.reset(driver)
+    block_requests(driver)
+    return driver
+
+def prepare_tab(driver):
+    """Set up a newly opened tab like the results tab: request blocking and the popup guard."""
+    block_requests(driver)
+    register_popup_guard(driver)
+
+def is_logged_in(driver):
+    """Return True if the current Indeed page belongs to a logged-in session.
+
+    The session cookies are checked first, the account menu in the page
+    header second.
+    """
+    try:
+        if any(cookie["name"] in LOGIN_COOKIES for cookie in driver.get_cookies()):
+            return True
+        return bool(driver.find_elements(By.CSS_SELECTOR, ACCOUNT_MENU_SELECTOR))
+    except Exception as e:
+        print(f"Could not check the login state: {e}")
+        return False
+
+def ensure_logged_in(driver):
+    """Confirm that the saved session is logged in; ask for a manual login only if it is not."""
+    if is_logged_in(driver):
+        print("Logged in with the saved session")
+        return
+    input("Not logged in or the session expired. Log in in the browser, then press Enter to continue...")
+    if is_logged_in(driver):
+        print("Login detected. Proceeding with job search...")
+    else:
+        print("No login detected, continuing anyway")
+
+def start_session(filters):
+    """Launch the browser, open Indeed and make sure the session is logged in.
+
+    Prints how long each startup phase took. With a cached chromedriver and
+    the login saved in the Chrome profile this takes a few seconds.
+    """
+    started = time.perf_counter()
+    with tracer.span("startup"):
+        driver = launch_browser(filters)
+        launched = time.perf_counter()
+        driver.get(filters.get("indeed_url", INDEED_URL))
+        opened = time.perf_counter()
+        ensure_logged_in(driver)
+        checked = time.perf_counter()
+        install_popup_guard(driver, filters)
+    print(f"Startup took {time.perf_counter() - started:.1f}s (browser {launched - started:.1f}s, "
+          f"Indeed {opened - launched:.1f}s, login check {checked - opened:.1f}s)")
+    return driver
+
+def pool_worker(worker_id, filters, cookies, tasks, results, apply_slots, run_id):
+    """Worker process of the pool: process the results pages handed out by the coordinator."""
+    set_wait_profile(filters.get("wait_profile", "normal"))
+    job_index = JobIndex(filters.get("job_index", "jobs.sqlite3"), run=run_id)
+    locators.load(filters.get("locator_stats", "locator_stats.json"))
+    job_filter.configure(filters)
+    answers.load(filters.get("answers", "answers.txt"),
+                 filters.get("unanswered_questions", "unanswered_questions.txt"))
+    if filters.get("trace"):
+        root, ext = os.path.splitext(filters["trace"])
+        tracer.configure(f"{root}.worker{worker_id}{ext}")
+    totals = {"inspected": 0, "skipped": 0, "applied": 0, "failed": 0}
+    driver = launch_browser(filters, multi_process=True)
+    try:
+        # Share the coordinator's logged-in session
+        driver.get(filters.get("indeed_url", INDEED_URL))
+        for cookie in cookies:
+            try:
+                driver.add_cookie(cookie)
+            except Exception as e:
+                print(f"[worker {worker_id}] Could not set cookie {cookie.get('name')}: {e}")
+        install_popup_guard(driver, filters)
+        while True:
+            task = tasks.get()
+            if task is None:
+                break
+            results.put({"event": "started", "worker": worker_id, "task": task})
+            stats = {"inspected": 0, "skipped": 0, "applied": 0, "failed": 0}
+            try:
+                with tracer.span("page_load"):
+                    driver.get(task["url"])
+                    wait_for(driver, "results_loaded", results_page_ready)
+                    check_results_page(driver)
+                listings = extract_listings(driver)
+                job_keys = [listing.job_key for listing in listings]
+                listings, reached_old = posted_since(listings, task["since"])
+                unseen = job_index.unseen(listings)
+                with tracer.span("results_page", url=task["url"]):
+                    process_results_page(driver, job_index, stats, apply_slots, listings=listings)
+                for key, value in stats.items():
+                    totals[key] += value
+                results.put({"event": "done", "worker": worker_id, "task": task, "stats": stats,
+                             "job_keys": job_keys, "unseen": unseen, "reached_old": reached_old})
+            except ResultsPageError as e:
+                # The browser is fine; let the coordinator hand the page out again
+                print(f"[worker {worker_id}] {task['url']}: {e}")
+                results.put({"event": "failed", "worker": worker_id, "task": task})
+            except Exception as e:
+                # Exit and let the coordinator replace this worker
+                print(f"[worker {worker_id}] Error processing {task['url']}: {e}")
+                raise
+    finally:
+        print_navigation_report()
+        tracer.report(totals)
+        tracer.close()
+        locators.save()
+        job_index.close()
+        try:
+            driver.quit()
+        except:
+            pass
+
+def run_worker_pool(filters, cookies, worker_count, job_index):
+    """Shard the results pages of the searches across worker_count Chrome sessions.
+
+    The coordinator hands out one results page per task, preferring the
+    searches with the most unseen postings and within pages_per_minute, and
+    keeps paging each search until a page shows no job keys that were not
+    seen before (or, in incremental mode, postings older than the last
+    finished run). A worker that crashes is replaced and its page handed out
+    again; a page that fails twice ends its search for this run. Pages may
+    overlap (Indeed repeats its last page past the end), so workers claim
+    every job in the job index before opening it.
+    """
+    ctx = multiprocessing.get_context("spawn")
+    tasks = ctx.Queue()
+    results = ctx.Queue()
+    apply_slots = ctx.Semaphore(int(filters.get("max_concurrent_applies", 2)))
+    max_restarts = int(filters.get("max_worker_restarts", 3))
+
+    started = time.time()
+    run_id = f"{os.getpid()}-{started}"
+    start_offset = int(filters.get("start_offset", 0))
+    rate_limit = page_rate_limit(filters)
+    incremental = is_enabled(filters, "incremental")
+    streams = {}
+    for query in search_queries(filters):
+        progress = SearchProgress(query, job_index.last_run(query.key) if incremental else None)
+        streams[query.key] = {"progress": progress, "next_start": start_offset, "done": False,
+                              "failed": False, "seen": set()}
+    totals = {"inspected": 0, "skipped": 0, "applied": 0, "failed": 0}
+    outstanding = 0
+    in_flight = {}
+    restarts = 0
+
+    def start_worker(worker_id):
+        process = ctx.Process(target=pool_worker, daemon=True,
+                              args=(worker_id, filters, cookies, tasks, results, apply_slots, run_id))
+        process.start()
+        return process
+
+    def open_streams():
+        return [stream for stream in streams.values() if not stream["done"]]
+
+    def refill():
+        nonlocal outstanding
+        while outstanding < worker_count * 2 and open_streams():
+            if rate_limit and not rate_limit.try_acquire():
+                return
+            # Searches not visited yet take turns, then the most productive goes first
+            stream = max(open_streams(), key=lambda stream: (stream["progress"].priority(), -stream["next_start"]))
+            progress = stream["progress"]
+            tasks.put({"search": progress.query.key, "start": stream["next_start"], "since": progress.since,
+                       "url": progress.query.url(filters, stream["next_start"])})
+            stream["next_start"] += RESULTS_PAGE_SIZE
+            outstanding += 1
+
+    def retry(task):
+        """Hand a page that failed out again, or give up on its search after the second failure."""
+        nonlocal outstanding
+        task["attempts"] = task.get("attempts", 0) + 1
+        if task["attempts"] < 2:
+            tasks.put(task)
+        else:
+            print(f"Giving up on {task['url']}")
+            stream = streams[task["search"]]
+            stream["failed"] = True
+            outstanding -= 1
+            # Stop handing out its pages; a failed stream is not recorded as finished
+            if not stream["done"]:
+                finish(stream)
+
+    def finish(stream):
+        stream["done"] = True
+        if not stream["failed"]:
+            job_index.finish_search(stream["progress"].query.key, started)
+
+    workers = {worker_id: start_worker(worker_id) for worker_id in range(worker_count)}
+    refill()
+    while outstanding > 0 or open_streams():
+        try:
+            message = results.get(timeout=1)
+        except queue.Empty:
+            message = None
+
+        if message and message["event"] == "started":
+            in_flight[message["worker"]] = message["task"]
+        elif message and message["event"] == "failed":
+            in_flight.pop(message["worker"], None)
+            retry(message["task"])
+        elif message:
+            in_flight.pop(message["worker"], None)
+            outstanding -= 1
+            for key, value in message["stats"].items():
+                totals[key] += value
+            stream = streams[message["task"]["search"]]
+            new_keys = set(message["job_keys"]) - stream["seen"]
+            stream["seen"].update(new_keys)
+            stream["progress"].unseen = message["unseen"]
+            stream["progress"].pages += 1
+            if not stream["done"] and (not new_keys or message["reached_old"]):
+                finish(stream)
+            print(f"[worker {message['worker']}] Page {message['task']['url']} done: "
+                  f"{len(new_keys)} new jobs, {totals['applied']} applications so far")
+            refill()
+        else:
+            # Only look for crashed workers once every message has been read,
+            # so a page is never handed out twice
+            for worker_id, process in list(workers.items()):
+                if process.is_alive():
+                    continue
+                print(f"[worker {worker_id}] exited with code {process.exitcode}")
+                task = in_flight.pop(worker_id, None)
+                if task:
+                    retry(task)
+                if restarts < max_restarts:
+                    restarts += 1
+                    workers[worker_id] = start_worker(worker_id)
+                else:
+                    del workers[worker_id]
+            # Pages held back by the rate limit
+            refill()
+        if not workers:
+            print("All workers failed, stopping the pool")
+            break
+
+    for _ in workers:
+        tasks.put(None)
+    for process in workers.values():
+        process.join(timeout=60)
+    return totals
+
+class TokenBucket:
+    """Rate limit shared by all searches: per_minute page loads, in bursts of up to burst."""
+
+    def __init__(self, per_minute, burst=3):
+        self.rate = per_minute / 60
+        self.capacity = max(1, burst)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def try_acquire(self):
+        """Take a token if one is available; return whether there was one."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+    def acquire(self):
+        """Take a token, waiting for one if necessary."""
+        while not self.try_acquire():
+            pause((1 - self.tokens) / self.rate)
+
+def page_rate_limit(filters):
+    """Return the TokenBucket for pages_per_minute, or None if page loads are not limited."""
+    per_minute = float(filters.get("pages_per_minute", 0))
+    if per_minute <= 0:
+        return None
+    return TokenBucket(per_minute, int(filters.get("page_burst", 3)))
+
+def posted_since(listings, since):
+    """Split off postings older than since (a Unix time, or None for no limit).
+
+    Return the remaining listings and whether any were older. Listings
+    without a posting time are kept.
+    """
+    if since is None:
+        return listings, False
+    fresh = [listing for listing in listings if listing.posted_at is None or listing.posted_at >= since]
+    return fresh, len(fresh) < len(listings)
+
+@dataclass
+class SearchProgress:
+    """Scheduling state of one search during a run."""
+    query: SearchQuery
+    since: Optional[float] = None  # start of the last finished run, in incremental mode
+    paginator: Optional["ResultsPaginator"] = None
+    unseen: Optional[int] = None  # postings without an outcome on the last page
+    pages: int = 0
+    failures: int = 0  # results pages in a row that did not load
+
+    def priority(self):
+        """Searches not visited yet go first, then those with the most unseen postings."""
+        return (self.unseen is None, self.unseen or 0, -self.pages)
+
+class ResultsPaginator:
+    """Walk the results pages of one search by URL, from a start offset on.
+
+    While the caller works through a page, the next one already loads in a
+    background tab, set up like the results tab; next_page() then only has to
+    switch over. Paging stops at the first page without unseen job keys.
+    Every page load takes a token from rate_limit, if given; the background
+    load is skipped when none is left.
+    """
+
+    def __init__(self, driver, filters, query, start=0, rate_limit=None):
+        self.driver = driver
+        self.filters = filters
+        self.query = query
+        self.rate_limit = rate_limit
+        self.start = start  # offset of the next page to show
+        self.page_start = None  # offset of the page shown now
+        self.prefetch = is_enabled(filters, "prefetch", default=True)
+        self.prefetched = None  # offset of the page loading in the "prefetch" tab
+        self.seen = set()
+
+    def next_page(self):
+        """Show the next results page and return its listings, or None after the last page."""
+        driver = self.driver
+        with tracer.span("page_load", start=self.start, prefetched=self.prefetched is not None):
+            if self.prefetched == self.start:
+                self.prefetched = None
+                windows.close(driver, "results", back_to="prefetch")
+                windows.rename("prefetch", "results")
+            else:
+                if self.rate_limit:
+                    self.rate_limit.acquire()
+                driver.get(self.query.url(self.filters, self.start))
+            wait_for(driver, "results_loaded", results_page_ready)
+            has_jobs = check_results_page(driver)
+        if not has_jobs:
+            print("No jobs match this search")
+            return None
+        listings = extract_listings(driver)
+        new_keys = {listing.job_key for listing in listings} - self.seen
+        if not new_keys:
+            print("No new jobs on this page, reached the last page")
+            return None
+        self.seen.update(new_keys)
+        self.page_start = self.start
+        self.start += RESULTS_PAGE_SIZE
+        if self.prefetch:
+            self.prefetch_next()
+        return listings
+
+    def prefetch_next(self):
+        """Start loading the next page in a background tab and return to the results tab."""
+        if self.rate_limit and not self.rate_limit.try_acquire():
+            return
+        driver = self.driver
+        try:
+            windows.open_tab(driver, "prefetch")
+            prepare_tab(driver)
+            # Assigning location returns at once, the page loads in the background
+            driver.execute_script("location.href = arguments[0]", self.query.url(self.filters, self.start))
+            self.prefetched = self.start
+        except Exception as e:
+            print(f"Could not prefetch the next results page: {e}")
+        finally:
+            windows.switch(driver, "results")
+
+    def close(self):
+        """Close the background tab, if one is open."""
+        if self.prefetched is None:
+            return
+        try:
+            windows.close(self.driver, "prefetch")
+        except Exception as e:
+            print(f"Could not close the prefetch tab: {e}")
+        finally:
+            self.prefetched = None
+
+def run_search(driver, filters, job_index, checkpoint=None):
+    """Work through the results pages of all searches, interleaved; return the stats.
+
+    The next page always comes from the search that had the most postings
+    without an outcome on its last page, and all page loads share the
+    pages_per_minute limit. In incremental mode results are sorted by date
+    and a search ends at the first posting older than its last finished run.
+    With a checkpoint the run continues where the saved run stopped, with the
+    applications it had queued, and saves its position after every job. With
+    apply_tabs set, applications run in
+    that many background tabs (see ApplyPipeline) while the results tab goes
+    on with the next jobs.
+    """
+    stats = {"inspected": 0, "skipped": 0, "applied": 0, "failed": 0}
+    if checkpoint and checkpoint.state["stats"]:
+        stats.update(checkpoint.state["stats"])
+    started = time.time()
+    start_offset = int(filters.get("start_offset", 0))
+    rate_limit = page_rate_limit(filters)
+    incremental = is_enabled(filters, "incremental")
+    searches = []
+    for query in search_queries(filters):
+        start = checkpoint.resume_start(query.key, start_offset) if checkpoint else start_offset
+        if start is None:
+            continue
+        searches.append(SearchProgress(query, job_index.last_run(query.key) if incremental else None,
+                                       ResultsPaginator(driver, filters, query, start, rate_limit)))
+    apply_tabs = int(filters.get("apply_tabs", 0))
+    pending = checkpoint.pending() if checkpoint else []
+    pipeline = None
+    if apply_tabs > 0 or pending:
+        pipeline = ApplyPipeline(driver, filters, job_index, stats, max(apply_tabs, 1),
+                                 int(filters.get("apply_queue", 5)), checkpoint)
+    current = None
+    try:
+        if pending:
+            # Applications still queued when the last run stopped
+            checkpoint.state["pending"] = []
+            known = job_index.known(listing.job_key for listing in pending)
+            for listing in pending:
+                if listing.job_key not in known:
+                    pipeline.push(listing)
+            if not apply_tabs:
+                pipeline.drain()
+                pipeline.close()
+                pipeline = None
+        while searches:
+            # On a tie stay with the current search, whose next page is already loading
+            search = max(searches, key=lambda search: (search.priority(), search is current))
+            if current is not None and current is not search:
+                # Only the search being worked on keeps a page loading in the background
+                current.paginator.close()
+            current = search
+            key = search.query.key
+            finished = failed = False
+            try:
+                # The first page of a search takes the place of submitting the search form
+                with tracer.span("pagination" if search.pages else "search", search=key):
+                    listings = search.paginator.next_page()
+                search.failures = 0
+            except Exception as e:
+                watchdog.check()
+                search.failures += 1
+                print(f"Error loading results page of {key}: {e}")
+                if search.failures < MAX_PAGE_ATTEMPTS:
+                    # Load the same page again after a pause
+                    pause(2 ** search.failures)
+                    continue
+                print(f"Giving up on {key} for this run")
+                listings, failed = None, True
+            if listings is None:
+                finished = True
+            else:
+                dated = any(listing.posted_at is not None for listing in listings)
+                listings, reached_old = posted_since(listings, search.since)
+                search.pages += 1
+                search.unseen = job_index.unseen(listings)
+                # Without posting times, a page of handled jobs marks the end of the new ones
+                if reached_old or (search.since and not dated and not search.unseen):
+                    print(f"Reached postings from before the last run of {key}")
+                    finished = True
+                if checkpoint:
+                    listings = checkpoint.start_page(key, search.paginator.page_start, listings)
+                with tracer.span("results_page", search=key, start=search.paginator.page_start):
+                    process_results_page(driver, job_index, stats, listings=listings, checkpoint=checkpoint,
+                                         pipeline=pipeline)
+            # An empty page may just be a dead browser; never mark the search done then
+            watchdog.check()
+            if finished:
+                search.paginator.close()
+                searches.remove(search)
+                # A search given up on resumes from its position next time
+                if not failed:
+                    if checkpoint:
+                        checkpoint.search_done(key)
+                    job_index.finish_search(key, started)
+        if pipeline:
+            pipeline.drain()
+    finally:
+        for search in searches:
+            search.paginator.close()
+        if pipeline and not watchdog.lost:
+            pipeline.close()
+    return stats
+
+class Supervisor:
+    """Run the search and start a new browser whenever the session is lost.
+
+    The new browser uses the same Chrome profile, so it is still logged in,
+    and the search continues from the checkpoint. The checkpoint also lets a
+    run that was stopped altogether resume on the next start.
+    """
+
+    def __init__(self, filters, job_index, driver):
+        self.filters = filters
+        self.job_index = job_index
+        self.driver = driver
+        self.checkpoint = Checkpoint(filters.get("checkpoint", "checkpoint.json"), filters)
+        self.max_restarts = int(filters.get("max_browser_restarts", 5))
+        self.watchdog_timeout = float(filters.get("watchdog_timeout", 120))
+
+    def run(self):
+        """Run the search to the end and return the stats."""
+        if self.checkpoint.load():
+            state = self.checkpoint.state
+            positions = ", ".join(f"{search} at offset {start}" for search, start in state["positions"].items())
+            print(f"Resuming from checkpoint: {len(state['done'])} searches done"
+                  f"{', ' + positions if positions else ''}")
+        restarts = 0
+        while True:
+            watchdog.attach(self.driver, self.watchdog_timeout)
+            try:
+                stats = run_search(self.driver, self.filters, self.job_index, self.checkpoint)
+                self.checkpoint.clear()
+                return stats
+            except SessionLost as e:
+                if restarts >= self.max_restarts:
+                    print(f"Browser session lost {restarts + 1} times, giving up")
+                    raise
+                restarts += 1
+                print(f"Browser session lost ({e}), starting a new browser "
+                      f"({restarts}/{self.max_restarts})")
+                self.relaunch()
+            finally:
+                watchdog.stop()
+
+    def relaunch(self):
+        """Replace the dead browser with a new one on the same profile."""
+        kill_browser(self.driver)
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
+        self.driver = start_session(self.filters)
+
+def format_time(timestamp):
+    """Local date and time of a Unix time, or "unknown"."""
+    return time.strftime("%Y-%m-%d %H:%M", time.localtime(timestamp)) if timestamp else "unknown"
+
+def print_job_lookup(job_index, jobs):
+    """Print what the job index knows about each job, given by job key or job URL."""
+    for job in jobs:
+        params = parse_qs(urlparse(job).query)
+        job_key = (params.get("jk") or params.get("vjk") or [job])[0]
+        row = job_index.lookup(job_key)
+        if not row:
+            print(f"{job_key}: not in the job index")
+            continue
+        print(f"{job_key}: {row['title'] or 'unknown title'} ({row['company'] or 'unknown company'})")
+        print(f"  posted: {format_time(row['posted_at'])}" + (f" ({row['posted']})" if row["posted"] else ""))
+        print(f"  first seen: {format_time(row['first_seen'])}")
+        if row["outcome"]:
+            print(f"  outcome: {row['outcome']} on {format_time(row['outcome_at'])}")
+        else:
+            print("  outcome: none yet")
 
 def main():
     """Launch an undetected Chrome session and automate job applications."""
+    parser = argparse.ArgumentParser(description="Apply to Indeed jobs with Easy Apply.")
+    parser.add_argument("--lookup", nargs="+", metavar="JOB",
+                        help="print what the job index knows about these jobs (job keys or URLs) and exit")
+    args = parser.parse_args()
     try:
         # Read job filters
         filters = read_job_filters()
+        set_wait_profile(filters.get("wait_profile", "normal"))
+        job_index = JobIndex(filters.get("job_index", "jobs.sqlite3"))
+        if args.lookup:
+            print_job_lookup(job_index, args.lookup)
+            return
+        locators.load(filters.get("locator_stats", "locator_stats.json"))
+        job_filter.configure(filters)
+        answers.load(filters.get("answers", "answers.txt"),
+                     filters.get("unanswered_questions", "unanswered_questions.txt"))
+        if filters.get("trace"):
+            tracer.configure(filters["trace"])
         
-        options = uc.ChromeOptions()
-        options.add_argument("--start-maximized")
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        
-        driver = uc.Chrome(options=options, version_main=133)
-        wait = WebDriverWait(driver, 10)
-        
-        # Open Indeed
-        driver.get("https://de.indeed.com/")  # German Indeed site
-        time.sleep(2)
-        
-        input("Press Enter after logging in to continue...")
-        print("Login detected. Proceeding with job search...")
+        driver = start_session(filters)
         
-        # Search for jobs
-        search_jobs(driver, filters)
+        # Pool mode: hand the logged-in session to parallel workers
+        worker_count = int(filters.get("workers", 1))
+        if worker_count > 1:
+            cookies = driver.get_cookies()
+            driver.quit()
+            stats = run_worker_pool(filters, cookies, worker_count, job_index)
+            print(f"\nApplication process completed. Applied to {stats['applied']} jobs.")
+            return
         
-        # Process job listings
-        jobs_applied = 0
-        while True:
-            try:
-                # Wait for job cards to load and get fresh references
-                time.sleep(2)
-                job_cards = wait.until(
-                    EC.presence_of_all_elements_located((By.CLASS_NAME, "job_seen_beacon"))
-                )
-                
-                for i in range(len(job_cards)):
-                    try:
-                        # Get fresh reference to job cards
-                        job_cards = wait.until(
-                            EC.presence_of_all_elements_located((By.CLASS_NAME, "job_seen_beacon"))
-                        )
-                        job_card = job_cards[i]
-                        
-                        # Close any popups
-                        close_popups(driver)
-                        
-                        # Try to click the job card safely
-                        if not click_job_card(driver, job_card):
-                            continue
-                        
-                        # Close popups that might appear after clicking
-                        close_popups(driver)
-                        
-                        # Check if it's an Easy Apply job
-                        if retry_with_backoff(lambda: is_easy_apply(driver)):
-                            print("Found Easy Apply job, attempting to apply...")
-                            if retry_with_backoff(lambda: apply_to_job(driver)):
-                                jobs_applied += 1
-                                print(f"Successfully applied! Total applications: {jobs_applied}")
-                        else:
-                            print("Skipping non-Easy Apply job")
-                        
-                        time.sleep(1)
-                    except IndexError:
-                        print("Reached end of current job cards")
-                        break
-                    except Exception as e:
-                        print(f"Error processing job card: {e}")
-                        continue
-                
-                # Try to click "Next" button
-                try:
-                    next_button = wait.until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, "[aria-label='Next']"))
-                    )
-                    if not next_button.is_enabled():
-                        print("Reached last page")
-                        break
-                    next_button.click()
-                    time.sleep(3)
-                except NoSuchElementException:
-                    print("No more pages")
-                    break
-                except Exception as e:
-                    print(f"Error navigating to next page: {e}")
-                    break
-                    
-            except Exception as e:
-                print(f"Error processing page: {e}")
-                break
+        supervisor = Supervisor(filters, job_index, driver)
+        try:
+            stats = supervisor.run()
+        finally:
+            driver = supervisor.driver
         
-        print(f"\nApplication process completed. Applied to {jobs_applied} jobs.")
+        print(f"\nApplication process completed. Applied to {stats['applied']} jobs.")
+        print_wait_report()
+        print_navigation_report()
+        tracer.report(stats)
         input("Press Enter to close the browser...")
         
     except Exception as e:
         print(f"An error occurred: {e}")
     finally:
+        locators.save()
+        tracer.close()
+        try:
+            job_index.close()
+        except:
+            pass
         try:
             driver.quit()
         except:
@@ -0,0 +1,70 @@
+import pytest
+
+from indeed_bot import AnswerStore, field_values
+
+ANSWERS = """\
+# screening answers
+years of experience python = 3
+Jahre Erfahrung Python = 3
+years of experience java = 1
+work permit EU = Yes
+Arbeitserlaubnis = Ja
+Gehaltsvorstellung = 25000
+salary expectation = 25000
+Deutschkenntnisse = Fließend
+"""
+
+
+@pytest.fixture
+def answers(tmp_path):
+    path = tmp_path / "answers.txt"
+    path.write_text(ANSWERS, encoding="utf-8")
+    store = AnswerStore()
+    store.load(path, tmp_path / "unanswered.txt")
+    return store
+
+
+@pytest.mark.parametrize("question, answer", [
+    ("How many years of Python experience do you have?", "3"),
+    ("Wie viele Jahre Erfahrung haben Sie mit Python?", "3"),
+    ("Wie viele Jahre Berufserfahrung haben Sie mit Python?", "3"),
+    ("How many years of Java experience do you have?", "1"),
+    ("Do you have a valid EU work permit?", "Yes"),
+    ("Besitzen Sie eine Arbeitserlaubnis?", "Ja"),
+    ("Was ist Ihre Gehaltsvorstellung (brutto/Jahr)?", "25000"),
+    ("What are your salary expectations?", "25000"),
+    ("Wie gut sind Ihre Deutschkenntnisse?", "Fließend"),
+])
+def test_lookup_finds_reworded_questions(answers, question, answer):
+    assert answers.lookup(question) == answer
+
+
+@pytest.mark.parametrize("question", [
+    "How many years of Rust experience do you have?",
+    "What is your favourite colour?",
+    "",
+])
+def test_lookup_rejects_other_questions(answers, question):
+    assert answers.lookup(question) is None
+
+
+def test_missing_answers_file_answers_nothing(tmp_path):
+    store = AnswerStore()
+    store.load(tmp_path / "missing.txt")
+    assert store.lookup("How many years of Python experience do you have?") is None
+
+
+def test_unanswered_questions_are_logged_once(answers, tmp_path):
+    answers.log_unanswered(["Favourite colour?", "Favourite colour?"])
+    answers.log_unanswered(["favourite colour"])
+    assert (tmp_path / "unanswered.txt").read_text(encoding="utf-8") == "Favourite colour? = \n"
+
+
+def test_choice_fields_match_option_texts():
+    radio = {"kind": "radio", "options": [{"element": "yes", "text": "Ja"}, {"element": "no", "text": "Nein"}]}
+    assert field_values(radio, "Yes") == [["yes", True]]
+    assert field_values(radio, "no") == [["no", True]]
+    select = {"kind": "select-one", "element": "select", "options": [
+        {"value": "", "text": "Bitte wählen"}, {"value": "c1", "text": "Fließend (C1)"}, {"value": "b1", "text": "Gut (B1)"}]}
+    assert field_values(select, "Fließend") == [["select", "c1"]]
+    assert field_values({"kind": "text", "element": "input", "options": []}, "3") == [["input", "3"]]
@@ -0,0 +1,93 @@
+import pytest
+
+from indeed_bot import Checkpoint, JobListing
+
+FILTERS = {"job_title": "Werkstudent", "location": "Potsdam", "search": ["Werkstudent Data; Berlin"]}
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "checkpoint.json")
+
+
+def listings(*job_keys):
+    return [JobListing(job_key, title=f"Job {job_key}") for job_key in job_keys]
+
+
+def keys(listings):
+    return [listing.job_key for listing in listings]
+
+
+def test_resumes_after_the_last_job_done_on_the_page(path):
+    checkpoint = Checkpoint(path, FILTERS)
+    stats = {"inspected": 2, "skipped": 0, "applied": 1, "failed": 0}
+    assert keys(checkpoint.start_page("a", 0, listings("1", "2", "3"))) == ["1", "2", "3"]
+    checkpoint.job_done("1", stats)
+    checkpoint.job_done("2", stats)
+
+    resumed = Checkpoint(path, FILTERS)
+    assert resumed.load()
+    assert resumed.state["stats"] == stats
+    assert resumed.resume_start("a", 100) == 0
+    assert resumed.resume_start("b", 100) == 100
+    assert keys(resumed.start_page("a", 0, listings("1", "2", "3"))) == ["3"]
+
+
+def test_a_changed_page_is_worked_through_from_the_top(path):
+    checkpoint = Checkpoint(path, FILTERS)
+    checkpoint.start_page("a", 10, listings("1", "2"))
+    checkpoint.job_done("1", {})
+
+    resumed = Checkpoint(path, FILTERS)
+    assert resumed.load()
+    # The last job done is gone from the page, so nothing is skipped
+    assert keys(resumed.start_page("a", 10, listings("4", "5"))) == ["4", "5"]
+    assert resumed.state["last_job_key"] is None
+    # Another page of the same search is not the page that was interrupted
+    resumed.job_done("4", {})
+    assert keys(resumed.start_page("a", 20, listings("4", "6"))) == ["4", "6"]
+
+
+def test_finished_searches_are_not_run_again(path):
+    checkpoint = Checkpoint(path, FILTERS)
+    checkpoint.start_page("a", 20, listings("1"))
+    checkpoint.job_done("1", {})
+    checkpoint.search_done("a")
+    assert checkpoint.state["page"] is None and checkpoint.state["last_job_key"] is None
+
+    resumed = Checkpoint(path, FILTERS)
+    assert resumed.load()
+    assert resumed.resume_start("a", 0) is None
+    assert "a" not in resumed.state["positions"]
+
+
+def test_queued_applications_stay_pending_until_they_are_done(path):
+    checkpoint = Checkpoint(path, FILTERS)
+    queued = [JobListing("1", title="Data", company="Beispiel GmbH", posted_at=1760313600.0, indeed_apply=True),
+              JobListing("2", title="Controlling")]
+    checkpoint.start_page("a", 0, queued)
+    for listing in queued:
+        checkpoint.job_queued(listing)
+        checkpoint.job_done(listing.job_key, {})
+    checkpoint.application_done("2", {"applied": 1})
+
+    resumed = Checkpoint(path, FILTERS)
+    assert resumed.load()
+    assert resumed.pending() == queued[:1]
+    assert resumed.state["stats"] == {"applied": 1}
+
+
+def test_checkpoint_of_other_searches_is_ignored(path):
+    Checkpoint(path, FILTERS).start_page("a", 30, listings("1"))
+    other = Checkpoint(path, dict(FILTERS, location="Berlin"))
+    assert not other.load()
+    assert other.resume_start("a", 0) == 0
+
+
+def test_unreadable_checkpoint_starts_over(path):
+    with open(path, "w") as file:
+        file.write('{"query": ')
+    checkpoint = Checkpoint(path, FILTERS)
+    assert not checkpoint.load()
+    checkpoint.clear()
+    checkpoint.clear()
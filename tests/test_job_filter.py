@@ -0,0 +1,62 @@
+import time
+
+from indeed_bot import JobFilter, JobListing
+
+
+def job_filter(**filters):
+    rules = JobFilter()
+    rules.configure(filters)
+    return rules
+
+
+def keeps(rules, **listing):
+    return rules.check(JobListing("key", **listing))[0]
+
+
+def test_no_rules_keep_everything():
+    rules = job_filter()
+    assert not rules.active
+    assert keeps(rules, title="Senior Engineer")
+
+
+def test_keywords_match_whole_words_and_phrases():
+    rules = job_filter(include_keywords="working student, werkstudent", exclude_keywords="senior, head of")
+    assert rules.active
+    assert keeps(rules, title="Working Student Data (m/w/d)")
+    assert keeps(rules, title="Werkstudent Controlling")
+    assert not keeps(rules, title="Senior Working Student")
+    assert not keeps(rules, title="Head of Working Students")
+    assert not keeps(rules, title="Student Assistant")
+    # "senior" is not a word of "seniority"
+    assert keeps(rules, title="Working Student seniority team")
+
+
+def test_regexes_match_the_lower_cased_title():
+    rules = job_filter(exclude_regex=[r"\bsr\.?\b", "(invalid"], include_regex=["praktik"])
+    assert keeps(rules, title="Praktikant IT-Support")
+    assert not keeps(rules, title="Sr. Praktikant")
+    assert not keeps(rules, title="Werkstudent")
+
+
+def test_reason_names_the_rule():
+    rules = job_filter(exclude_keywords="senior")
+    assert rules.check(JobListing("key", title="Senior Backend Engineer")) == (
+        False, "title contains excluded keyword 'senior'")
+
+
+def test_companies_and_locations():
+    rules = job_filter(exclude_companies="Example GmbH", locations="Potsdam, remote")
+    assert not keeps(rules, title="Werkstudent", company="example  gmbh", location="Potsdam")
+    assert not keeps(rules, title="Werkstudent", company="Other AG", location="Hamburg")
+    assert keeps(rules, title="Werkstudent", company="Other AG", location="Remote in Potsdam")
+    assert keeps(rules, title="Werkstudent", company="Other AG")
+
+
+def test_posting_age():
+    rules = job_filter(max_age_days="14")
+    assert keeps(rules, title="Werkstudent", posted="vor 3 Tagen")
+    assert not keeps(rules, title="Werkstudent", posted="vor 30 Tagen")
+    assert not keeps(rules, title="Werkstudent", posted="30+ days ago")
+    assert keeps(rules, title="Werkstudent", posted="Heute")
+    assert not keeps(rules, title="Werkstudent", posted_at=time.time() - 20 * 86400)
+    assert keeps(rules, title="Werkstudent")
@@ -0,0 +1,112 @@
+import sqlite3
+
+import pytest
+
+from indeed_bot import JobIndex, JobListing, print_job_lookup
+
+
+@pytest.fixture
+def index_path(tmp_path):
+    return str(tmp_path / "jobs.sqlite3")
+
+
+def test_workers_of_one_run_never_share_a_job(index_path):
+    first, second = JobIndex(index_path, run="run-1"), JobIndex(index_path, run="run-1")
+    try:
+        assert first.claim("a")
+        assert not second.claim("a")
+        assert not first.claim("a")
+        assert second.claim("b")
+    finally:
+        first.close()
+        second.close()
+
+
+def test_a_later_run_takes_over_old_claims(index_path):
+    earlier = JobIndex(index_path, run="run-1")
+    assert earlier.claim("a")
+    earlier.close()
+    later = JobIndex(index_path, run="run-2")
+    try:
+        assert later.claim("a")
+    finally:
+        later.close()
+
+
+def test_without_a_run_every_claim_succeeds(index_path):
+    index = JobIndex(index_path)
+    try:
+        assert index.claim("a")
+        assert index.claim("a")
+    finally:
+        index.close()
+
+
+def test_keeps_the_posting_time_next_to_the_card_text(index_path):
+    index = JobIndex(index_path)
+    index.record("a", "Werkstudent Data", "Beispiel GmbH", "vor 3 Tagen", posted_at=1760313600.0)
+    index.record("a", outcome="applied")
+    index.close()
+    index = JobIndex(index_path)
+    try:
+        job = index.lookup("a")
+        assert (job["posted"], job["posted_at"], job["outcome"]) == ("vor 3 Tagen", 1760313600.0, "applied")
+    finally:
+        index.close()
+
+
+def test_adds_the_posting_time_to_an_older_index(index_path):
+    conn = sqlite3.connect(index_path)
+    conn.execute("CREATE TABLE jobs (job_key TEXT PRIMARY KEY, title TEXT, company TEXT, posted TEXT, "
+                 "easy_apply INTEGER, outcome TEXT, outcome_at REAL, first_seen REAL NOT NULL, "
+                 "updated REAL NOT NULL) WITHOUT ROWID")
+    conn.execute("INSERT INTO jobs VALUES ('a', 'Old', NULL, 'Heute', 1, 'applied', 1, 1, 1)")
+    conn.commit()
+    conn.close()
+    index = JobIndex(index_path)
+    index.record("b", posted_at=1760313600.0)
+    index.close()
+    index = JobIndex(index_path)
+    try:
+        assert index.lookup("a")["posted_at"] is None
+        assert index.lookup("b")["posted_at"] == 1760313600.0
+        assert index.known(["a", "b"]) == {"a"}
+    finally:
+        index.close()
+
+
+def test_lookup_accepts_job_keys_and_urls(index_path, capsys):
+    index = JobIndex(index_path)
+    index.record("a", "Werkstudent Data", "Beispiel GmbH", "vor 3 Tagen", outcome="applied")
+    index.close()
+    index = JobIndex(index_path)
+    try:
+        print_job_lookup(index, ["https://de.indeed.com/viewjob?jk=a&from=serp", "b"])
+    finally:
+        index.close()
+    output = capsys.readouterr().out
+    assert "a: Werkstudent Data (Beispiel GmbH)" in output
+    assert "(vor 3 Tagen)" in output
+    assert "outcome: applied on" in output
+    assert "b: not in the job index" in output
+
+
+def test_only_final_outcomes_count_as_known(index_path):
+    index = JobIndex(index_path)
+    index.record("applied", outcome="applied")
+    index.record("not_easy_apply", outcome="not_easy_apply")
+    index.record("failed", outcome="failed")
+    index.record("filtered", outcome="filtered")
+    index.record("seen", title="No outcome yet")
+    job_keys = ["applied", "not_easy_apply", "failed", "filtered", "seen", "new", None]
+    try:
+        # Known within the run before the writer committed anything
+        assert index.known(job_keys) == {"applied", "not_easy_apply"}
+    finally:
+        index.close()
+    index = JobIndex(index_path)
+    try:
+        assert index.known(job_keys) == {"applied", "not_easy_apply"}
+        assert index.unseen([JobListing(key) for key in ("applied", "failed", "new")]) == 2
+    finally:
+        index.close()
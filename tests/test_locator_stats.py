@@ -0,0 +1,72 @@
+import pytest
+
+import indeed_bot
+from indeed_bot import EASY_APPLY_FALLBACK_SELECTOR, EASY_APPLY_SELECTORS, LocatorStats, find_easy_apply_button
+
+
+def test_unknown_strategies_keep_their_order():
+    stats = LocatorStats()
+    assert stats.rank("form_step", ["a", "b", "c"]) == ["a", "b", "c"]
+    stats.record("form_step", "c", True, 0.01)
+    assert stats.rank("form_step", ["a", "b", "c"]) == ["c", "a", "b"]
+    stats.record("form_step", "a", False, 0.01)
+    assert stats.rank("form_step", ["a", "b", "c"]) == ["c", "b", "a"]
+    # Contexts are ranked on their own
+    assert stats.rank("easy_apply", ["a", "b", "c"]) == ["a", "b", "c"]
+
+
+def markup_change(stats):
+    """A strategy that worked for a long time, then stopped working while another took over."""
+    for _ in range(30):
+        stats.record("form_step", "old", True, 0.01)
+    for hit in (False, True, True, True):
+        stats.record("form_step", "old", False, 0.01)
+        stats.record("form_step", "new", hit, 0.01)
+    return stats.rank("form_step", ["old", "new"])
+
+
+def test_recent_results_outweigh_old_ones():
+    assert markup_change(LocatorStats(decay=0.8)) == ["new", "old"]
+    # Without decay the long run of hits would keep the broken strategy first
+    assert markup_change(LocatorStats(decay=1.0)) == ["old", "new"]
+
+
+def test_statistics_survive_a_restart(tmp_path):
+    path = str(tmp_path / "locator_stats.json")
+    stats = LocatorStats()
+    stats.load(path)
+    stats.record("form_step", "b", True, 0.02)
+    stats.save()
+    reloaded = LocatorStats()
+    reloaded.load(path)
+    assert reloaded.rank("form_step", ["a", "b"]) == ["b", "a"]
+    assert reloaded.stats["form_step"]["b"]["ms"] == pytest.approx(20)
+
+
+class ProbeDriver:
+    """Answers the button probe with a button matched by one of the probed selectors."""
+
+    def __init__(self, selector):
+        self.selector = selector
+        self.probed = None
+
+    def execute_script(self, script, selectors):
+        self.probed = selectors
+        return [{"selector": self.selector, "visible": True, "text": "schnellbewerbung",
+                 "background": "", "element": object()}]
+
+
+def test_catch_all_selector_is_probed_last_and_never_ranked(monkeypatch):
+    stats = LocatorStats()
+    monkeypatch.setattr(indeed_bot, "locators", stats)
+    for _ in range(5):
+        driver = ProbeDriver(EASY_APPLY_FALLBACK_SELECTOR)
+        assert find_easy_apply_button(driver)
+        assert driver.probed[-1] == EASY_APPLY_FALLBACK_SELECTOR
+    assert EASY_APPLY_FALLBACK_SELECTOR not in stats.stats["easy_apply"]
+
+    driver = ProbeDriver(EASY_APPLY_SELECTORS[-1])
+    find_easy_apply_button(driver)
+    driver = ProbeDriver(EASY_APPLY_FALLBACK_SELECTOR)
+    find_easy_apply_button(driver)
+    assert driver.probed == [EASY_APPLY_SELECTORS[-1], *EASY_APPLY_SELECTORS[:-1], EASY_APPLY_FALLBACK_SELECTOR]
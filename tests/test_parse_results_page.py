@@ -0,0 +1,119 @@
+import json
+import os
+import re
+
+import fake_indeed
+from indeed_bot import NO_RESULTS_SELECTOR, NO_RESULTS_TEXTS, parse_results_page
+
+PAYLOAD_SCRIPT = re.compile(r"<script>window\.mosaic.*?</script>", re.S)
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+# The jobs of both fixture pages: job key, title, company, location, posted, Indeed Apply
+FIXTURE_JOBS = [
+    ("9c1e7b2a4f6d8e03", "Werkstudent (m/w/d) Data Analytics", "Beispiel Analytics GmbH", "14467 Potsdam",
+     "Vor 3 Tagen", True),
+    ("2b8d4f1a6c3e9070", "Working Student Software Engineering (f/m/d)", "Muster & Söhne AG", "Berlin",
+     "Heute", True),
+    ("5f0a3c7e1d9b2486", "Praktikant IT-Support", "Havelland Systems", "Potsdam", "Vor 30+ Tagen", False),
+    ("d47e2a9c0b3f5168", "Werkstudent Controlling – Finanzen", "Nordlicht Logistik SE", "Teltow",
+     "Gerade veröffentlicht", True),
+    ("80c6f3b5a2e7d914", "Junior Data Engineer", "Beispiel Analytics GmbH", "Homeoffice in Potsdam",
+     "Vor 7 Tagen", False),
+]
+
+
+def fixture(name):
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as file:
+        return file.read()
+
+
+def fields(listing):
+    return (listing.job_key, listing.title, listing.company, listing.location, listing.posted,
+            listing.indeed_apply)
+
+
+def results_page(**site_options):
+    site = fake_indeed.FakeIndeed(jobs=25, popup_rate=0, **site_options)
+    html = site.results_page({"q": "Working Student", "l": "Potsdam"})
+    return site, html
+
+
+def payload_page(results):
+    data = {"metaData": {"mosaicProviderJobCardsModel": {"results": results}}}
+    return ('<script>window.mosaic.providerData["mosaic-provider-jobcards"]='
+            f"{json.dumps(data)};</script>")
+
+
+def test_reads_the_job_data_of_an_indeed_page():
+    listings = parse_results_page(fixture("indeed_results_payload.html"))
+    assert [fields(listing) for listing in listings] == FIXTURE_JOBS
+    assert [listing.posted_at for listing in listings] == [
+        1760313600.0, 1760572800.0, 1757548800.0, 1760605200.0, 1759968000.0]
+
+
+def test_reads_the_job_cards_of_an_indeed_page():
+    listings = parse_results_page(fixture("indeed_results_markup.html"))
+    assert [fields(listing) for listing in listings] == FIXTURE_JOBS
+    assert all(listing.posted_at is None for listing in listings)
+
+
+def test_reads_the_embedded_job_data():
+    site, html = results_page()
+    listings = parse_results_page(html)
+    jobs = site.jobs[:fake_indeed.PAGE_SIZE]
+    assert [listing.job_key for listing in listings] == [job["job_key"] for job in jobs]
+    for listing, job in zip(listings, jobs):
+        assert listing.title == job["title"]
+        assert listing.company == job["company"]
+        assert listing.location == job["location"]
+        assert listing.posted == f"vor {job['age_days']} Tagen"
+        assert listing.posted_at is not None
+        assert listing.indeed_apply is job["easy_apply"]
+
+
+def test_falls_back_to_the_card_markup():
+    site, html = results_page()
+    listings = parse_results_page(PAYLOAD_SCRIPT.sub("", html))
+    jobs = site.jobs[:fake_indeed.PAGE_SIZE]
+    assert [listing.job_key for listing in listings] == [job["job_key"] for job in jobs]
+    for listing, job in zip(listings, jobs):
+        assert listing.title == job["title"]
+        assert listing.company == job["company"]
+        assert listing.location == job["location"]
+        assert listing.posted == f"vor {job['age_days']} Tagen"
+        assert listing.posted_at is None
+        assert listing.indeed_apply is job["easy_apply"]
+
+
+def test_markup_without_any_apply_label_leaves_the_apply_type_open():
+    _, html = results_page(easy_apply_rate=0)
+    listings = parse_results_page(PAYLOAD_SCRIPT.sub("", html))
+    assert listings
+    assert all(listing.indeed_apply is None for listing in listings)
+
+
+def test_job_data_without_apply_flags_leaves_the_apply_type_open():
+    listings = parse_results_page(payload_page([{"jobkey": "a"}, {"jobkey": "b"}]))
+    assert [listing.indeed_apply for listing in listings] == [None, None]
+
+
+def test_missing_apply_flag_is_unknown_next_to_flagged_jobs():
+    listings = parse_results_page(payload_page([
+        {"jobkey": "a", "indeedApplyEnabled": True},
+        {"jobkey": "b", "indeedApplyEnabled": False},
+        {"jobkey": "c"},
+    ]))
+    assert [listing.indeed_apply for listing in listings] == [True, False, None]
+
+
+def test_page_without_jobs_has_no_listings():
+    assert parse_results_page("<html><body><p>Keine Ergebnisse</p></body></html>") == []
+
+
+def test_search_without_matches_shows_the_no_results_message():
+    site = fake_indeed.FakeIndeed(jobs=25, popup_rate=0)
+    html = site.results_page({"q": "Working Student", "jt": "temporary"})
+    assert parse_results_page(html) == []
+    assert "mosaic-provider-jobcards" not in html
+    assert NO_RESULTS_SELECTOR.lstrip(".") in html
+    assert any(text in html.lower() for text in NO_RESULTS_TEXTS)
@@ -0,0 +1,34 @@
+import pytest
+
+import indeed_bot
+from indeed_bot import count_dismissed_popups
+
+
+@pytest.fixture(autouse=True)
+def popup_guard(monkeypatch):
+    guard = dict(indeed_bot.popup_guard, dismissed=0, documents={})
+    monkeypatch.setattr(indeed_bot, "popup_guard", guard)
+    return guard
+
+
+def test_counts_each_document_from_its_own_start(popup_guard, capsys):
+    count_dismissed_popups("results-1", 2)
+    count_dismissed_popups("results-1", 2)
+    # The next page load starts counting at 0 again
+    count_dismissed_popups("results-2", 1)
+    # Another tab's document interleaved with the first
+    count_dismissed_popups("apply-tab", 0)
+    count_dismissed_popups("results-2", 3)
+    assert popup_guard["dismissed"] == 5
+    assert capsys.readouterr().out.splitlines() == [
+        "Popup guard dismissed 2 popup(s)",
+        "Popup guard dismissed 1 popup(s)",
+        "Popup guard dismissed 2 popup(s)",
+    ]
+
+
+def test_keeps_only_recent_documents(popup_guard):
+    for document in range(indeed_bot.POPUP_GUARD_DOCUMENTS + 5):
+        count_dismissed_popups(str(document), 1)
+    assert len(popup_guard["documents"]) == indeed_bot.POPUP_GUARD_DOCUMENTS
+    assert popup_guard["dismissed"] == indeed_bot.POPUP_GUARD_DOCUMENTS + 5
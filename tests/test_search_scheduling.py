@@ -0,0 +1,82 @@
+import indeed_bot
+from indeed_bot import (JobListing, SearchProgress, SearchQuery, TokenBucket, page_rate_limit, posted_since,
+                        search_queries)
+
+
+def test_job_title_and_location_make_one_search_per_job_type():
+    assert search_queries({"job_title": "Werkstudent", "location": "Potsdam"}) == [
+        SearchQuery("Werkstudent", "Potsdam")]
+    queries = search_queries({"job_title": "Werkstudent", "location": "Potsdam", "job_type": "parttime, internship"})
+    assert [query.key for query in queries] == ["Werkstudent|Potsdam|parttime", "Werkstudent|Potsdam|internship"]
+
+
+def test_search_lines_replace_job_title_and_location():
+    filters = {
+        "job_title": "Ignored",
+        "job_type": "parttime",
+        "search": ["Werkstudent Data; Berlin", "Working Student Marketing; Potsdam; fulltime, internship",
+                   "missing location", "; Berlin"],
+    }
+    assert search_queries(filters) == [
+        SearchQuery("Werkstudent Data", "Berlin", "parttime"),
+        SearchQuery("Working Student Marketing", "Potsdam", "fulltime"),
+        SearchQuery("Working Student Marketing", "Potsdam", "internship"),
+    ]
+
+
+def test_no_searches_without_a_job_title():
+    assert search_queries({"location": "Potsdam"}) == []
+
+
+def test_posted_since_splits_off_older_postings():
+    listings = [JobListing("new", posted_at=2000.0), JobListing("undated"), JobListing("old", posted_at=999.0)]
+    assert posted_since(listings, None) == (listings, False)
+    fresh, reached_old = posted_since(listings, 1000.0)
+    assert [listing.job_key for listing in fresh] == ["new", "undated"]
+    assert reached_old
+    assert posted_since(listings[:2], 1000.0) == (listings[:2], False)
+
+
+def test_unvisited_searches_go_first_then_the_most_unseen_postings():
+    searches = {name: SearchProgress(SearchQuery(name, "Potsdam")) for name in ("busy", "quiet", "new", "deep")}
+    searches["busy"].unseen, searches["busy"].pages = 8, 3
+    searches["quiet"].unseen, searches["quiet"].pages = 1, 1
+    searches["deep"].unseen, searches["deep"].pages = 8, 5
+    order = sorted(searches.values(), key=SearchProgress.priority, reverse=True)
+    assert [search.query.job_title for search in order] == ["new", "busy", "deep", "quiet"]
+
+
+def test_token_bucket_allows_a_burst_then_refills_over_time():
+    bucket = TokenBucket(per_minute=6, burst=2)
+    assert bucket.try_acquire()
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+    # Ten seconds at six pages per minute bring back one token
+    bucket.updated -= 10
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+    # An idle bucket never holds more than the burst
+    bucket.updated -= 600
+    assert [bucket.try_acquire() for _ in range(3)] == [True, True, False]
+
+
+def test_token_bucket_acquire_waits_for_the_next_token(monkeypatch):
+    bucket = TokenBucket(per_minute=60, burst=1)
+    waits = []
+
+    def pause(seconds):
+        waits.append(seconds)
+        bucket.updated -= seconds
+
+    monkeypatch.setattr(indeed_bot, "pause", pause)
+    bucket.acquire()
+    assert waits == []
+    bucket.acquire()
+    assert len(waits) == 1 and 0 < waits[0] <= 1
+
+
+def test_page_rate_limit_is_off_by_default():
+    assert page_rate_limit({}) is None
+    assert page_rate_limit({"pages_per_minute": "0"}) is None
+    bucket = page_rate_limit({"pages_per_minute": "20", "page_burst": "5"})
+    assert bucket.capacity == 5 and bucket.rate == 20 / 60